@@ -6,7 +6,8 @@ from types import SimpleNamespace
 from typing import List, Tuple
 
 from ..domain import Restaurant, RestaurantType
-from ..core.turn import allocate_demand, clamp_capacity, menu_price_median
+from ..core.market import allocate_demand, clamp_capacity
+from ..rules.scoring import menu_price_median
 from foodops.ui.director_office import bureau_directeur  # garde ta signature actuelle
 from ..core.accounting import (
     month_amortization, post_sales, post_cogs, post_services_ext,
@@ -173,6 +174,7 @@ def _apply_client_losses(resto: Restaurant, demanded: int, cap_rh: int, cap_serv
         try:
             noto = float(getattr(resto, "notoriety", 0.5))
             resto.notoriety = max(0.0, min(1.0, round(noto * (1.0 - delta), 3)))
+            resto.touch_menu()
         except Exception:
             pass
 
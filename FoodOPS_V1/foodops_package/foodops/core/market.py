@@ -23,7 +23,7 @@ from dataclasses import dataclass
 from math import sqrt
 
 from ..domain import Restaurant, RestaurantType
-from ..rules.scoring import attraction_score, menu_price_median
+from ..rules.scoring import attraction_matrix, menu_price_median
 from ..data.scenario_presets import Scenario
 
 # ------------------------------
@@ -61,13 +61,9 @@ CANNI_ALPHA: float = 0.50
 @dataclass(frozen=True)
 class _SegShim:
     """Shim minimal pour réutiliser attraction_score(resto, ProfilClient-like)."""
-    type_client: object
+    type_client: str  # clé de segment ("étudiant", "actif"…)
     budget_moyen: float
 
-@dataclass(frozen=True)
-class _TypeShim:
-    value: str
-
 
 def _cap_exploitable(resto: Restaurant) -> int:
     """
@@ -106,22 +102,35 @@ def _segment_quantities(sc: Scenario) -> Dict[str, int]:
     return demand
 
 
+def _segment_scores(restos: List[Restaurant], segments: List[str]) -> Dict[str, List[float]]:
+    """
+    Scores d'attraction de chaque resto, par segment : {segment: [score_resto_0, ...]}.
+    Toute la matrice est calculée d'un coup (une seule passe par restaurant).
+    """
+    # Shims ProfilClient-like
+    seg_objs = [
+        _SegShim(type_client=seg, budget_moyen=SEGMENT_BUDGET.get(seg, 15.0))
+        for seg in segments
+    ]
+    matrix = attraction_matrix(restos, seg_objs)
+    return {seg: [row[j] for row in matrix] for j, seg in enumerate(segments)}
+
+
 def _ranked_for_segment(
     restos: List[Restaurant],
     segment: str,
-    counts_by_type: Dict[RestaurantType, int]
+    counts_by_type: Dict[RestaurantType, int],
+    scores: List[float],
 ) -> List[Tuple[int, float]]:
     """
     Classement (idx, score) décroissant pour un segment donné, en filtrant hors budget
-    et en appliquant la pénalité de cannibalisation.
+    et en appliquant la pénalité de cannibalisation. `scores[idx]` = score d'attraction du resto idx.
     """
     ranked: List[Tuple[int, float]] = []
     for idx, r in enumerate(restos):
         if not _eligible_by_budget(r, segment):
             continue
-        # Shim ProfilClient-like
-        seg_obj = _SegShim(type_client=_TypeShim(value=segment), budget_moyen=SEGMENT_BUDGET.get(segment, 15.0))
-        base_score = max(0.0, attraction_score(r, seg_obj))
+        base_score = max(0.0, scores[idx])
         penal = _cannibalization_factor(r, counts_by_type)
         ranked.append((idx, base_score * penal))
     ranked.sort(key=lambda x: x[1], reverse=True)
@@ -139,6 +148,7 @@ def allocate_demand(restaurants: List[Restaurant], scenario: Scenario) -> Dict[i
     """
     demand_by_seg = _segment_quantities(scenario)
     counts_by_type = _count_by_type(restaurants)
+    scores_by_seg = _segment_scores(restaurants, list(demand_by_seg))
 
     # Capacité exploitable restante par resto
     capacity_left: Dict[int, int] = {i: _cap_exploitable(r) for i, r in enumerate(restaurants)}
@@ -148,7 +158,7 @@ def allocate_demand(restaurants: List[Restaurant], scenario: Scenario) -> Dict[i
         if qty <= 0:
             continue
 
-        ranked = _ranked_for_segment(restaurants, seg, counts_by_type)
+        ranked = _ranked_for_segment(restaurants, seg, counts_by_type, scores_by_seg[seg])
 
         # Si aucun resto éligible au budget de ce segment → tout perdu
         if not ranked:
@@ -195,12 +205,13 @@ def estimate_lost_customers(restaurants: List[Restaurant], scenario: Scenario) -
     """
     demand_by_seg = _segment_quantities(scenario)
     counts_by_type = _count_by_type(restaurants)
+    scores_by_seg = _segment_scores(restaurants, list(demand_by_seg))
     capacity_left: Dict[int, int] = {i: _cap_exploitable(r) for i, r in enumerate(restaurants)}
     lost_total = 0
 
     for seg, qty in demand_by_seg.items():
         remaining = qty
-        ranked = _ranked_for_segment(restaurants, seg, counts_by_type)
+        ranked = _ranked_for_segment(restaurants, seg, counts_by_type, scores_by_seg[seg])
         if not ranked:
             lost_total += remaining
             continue
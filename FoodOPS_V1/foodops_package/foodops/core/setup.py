@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
+import sys
+
 from ..domain import Restaurant, RestaurantType
 from ..data.locals_presets import DEFAULT_LOCALS
 from ..data.menus_presets_simple import get_default_menus_simple
 from .finance import propose_financing
 from .accounting import Ledger, post_opening, balance_sheet
+from ..formatting import fmt_eur
+from ..parsing import parse_int
+
+_SEP_EQ52 = "═" * 52
 
-def _fmt_eur(x: float) -> str:
-    return f"{x:,.0f} €".replace(",", " ").replace(".0", "")
+_fmt_eur = fmt_eur
 
 def _print_opening_balance(restaurant: Restaurant):
     # Solde des comptes à l'ouverture (tour 0)
@@ -16,20 +21,35 @@ def _print_opening_balance(restaurant: Restaurant):
     a = bs["Actif"]
     p = bs["Passif"]
 
-    print("\n🧾  Bilan d’ouverture —", restaurant.name)
-    print("═" * 52)
-    print("ACTIF")
-    print(f"  🏭 Immobilisations (215)        : {_fmt_eur(a['Immobilisations (215)'])}")
-    print(f"  (–) Amort. cumulés (2815)      : {_fmt_eur(a['Amortissements cumulés (2815)'])}")
-    print(f"  =  Immobilisations nettes      : {_fmt_eur(a['Immobilisations nettes'])}")
-    print(f"  💶 Trésorerie (512)             : {_fmt_eur(a['Trésorerie (512)'])}")
-    print(f"  👉 TOTAL ACTIF                  : {_fmt_eur(a['Total Actif'])}")
-
-    print("\nPASSIF")
-    print(f"  🧱 Capitaux propres (101)       : {_fmt_eur(p['Capitaux propres (101)'])}")
-    print(f"  🏦 Emprunts (164)               : {_fmt_eur(p['Emprunts (164)'])}")
-    print(f"  👉 TOTAL PASSIF                 : {_fmt_eur(p['Total Passif'])}")
-    print("═" * 52)
+    lines = [
+        f"\n🧾  Bilan d’ouverture — {restaurant.name}",
+        _SEP_EQ52,
+        "ACTIF",
+        f"  🏭 Immobilisations (215)        : {_fmt_eur(a['Immobilisations (215)'])}",
+        f"  (–) Amort. cumulés (2815)      : {_fmt_eur(a['Amortissements cumulés (2815)'])}",
+        f"  =  Immobilisations nettes      : {_fmt_eur(a['Immobilisations nettes'])}",
+        f"  💶 Trésorerie (512)             : {_fmt_eur(a['Trésorerie (512)'])}",
+        f"  👉 TOTAL ACTIF                  : {_fmt_eur(a['Total Actif'])}",
+
+        "\nPASSIF",
+        f"  🧱 Capitaux propres (101)       : {_fmt_eur(p['Capitaux propres (101)'])}",
+        f"  🏦 Emprunts (164)               : {_fmt_eur(p['Emprunts (164)'])}",
+        f"  👉 TOTAL PASSIF                 : {_fmt_eur(p['Total Passif'])}",
+        _SEP_EQ52,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _print_financing_summary(r: Restaurant, local, equip_default: float, plan) -> None:
+    lines = [
+        f"\n💼  {r.name} — {r.type.value}",
+        f"📍 Local: {local.nom}  |  Capacité: {local.capacite_clients} couverts/jour  |  Loyer: {_fmt_eur(local.loyer)}/mois",
+        f"🧰 Équipement initial : {_fmt_eur(equip_default)}",
+        f"🏦 Banque : {_fmt_eur(plan.bank_loan)}  → Mensualité ~ {_fmt_eur(plan.bank_monthly)}",
+        f"🏛️ BPI   : {_fmt_eur(plan.bpi_loan)}   → Mensualité ~ {_fmt_eur(plan.bpi_monthly)}",
+        f"🧾 Frais de dossier (3%) : {_fmt_eur(plan.frais_dossier)}",
+        f"💶 Trésorerie de départ  : {_fmt_eur(plan.cash_initial)}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def create_restaurants():
     restaurants = []
@@ -38,24 +58,18 @@ def create_restaurants():
 
     # Saisie du nombre de joueurs ici (la CLI n’envoie plus le param)
     while True:
-        try:
-            nb_joueurs = int(input("Nombre de joueurs (1–8) : ").strip())
-            if 1 <= nb_joueurs <= 8:
-                break
-        except Exception:
-            pass
+        nb_joueurs = parse_int(input("Nombre de joueurs (1–8) : "))
+        if nb_joueurs is not None and 1 <= nb_joueurs <= 8:
+            break
         print("  ⚠️  Saisis un entier entre 1 et 8.")
 
     for i in range(nb_joueurs):
         print(f"\n— Joueur {i+1} —")
         print("Types : 1) Fast Food  2) Bistrot  3) Gastronomique")
         while True:
-            try:
-                t = int(input("Type de restaurant : ").strip())
-                if t in (1, 2, 3):
-                    break
-            except Exception:
-                pass
+            t = parse_int(input("Type de restaurant : "))
+            if t in (1, 2, 3):
+                break
             print("  ⚠️  Choisis 1, 2 ou 3.")
 
         type_keys = {1: "FAST_FOOD", 2: "BISTRO", 3: "GASTRO"}
@@ -98,13 +112,7 @@ def create_restaurants():
         )
 
         # Résumé financement et bilan d’ouverture
-        print(f"\n💼  {r.name} — {r.type.value}")
-        print(f"📍 Local: {local.nom}  |  Capacité: {local.capacite_clients} couverts/jour  |  Loyer: {_fmt_eur(local.loyer)}/mois")
-        print(f"🧰 Équipement initial : {_fmt_eur(equip_default)}")
-        print(f"🏦 Banque : {_fmt_eur(plan.bank_loan)}  → Mensualité ~ {_fmt_eur(plan.bank_monthly)}")
-        print(f"🏛️ BPI   : {_fmt_eur(plan.bpi_loan)}   → Mensualité ~ {_fmt_eur(plan.bpi_monthly)}")
-        print(f"🧾 Frais de dossier (3%) : {_fmt_eur(plan.frais_dossier)}")
-        print(f"💶 Trésorerie de départ  : {_fmt_eur(plan.cash_initial)}")
+        _print_financing_summary(r, local, equip_default, plan)
 
         _print_opening_balance(r)
 
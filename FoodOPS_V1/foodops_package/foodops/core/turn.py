@@ -4,7 +4,8 @@ from types import SimpleNamespace
 from typing import List, Tuple
 
 from ..domain import Restaurant
-from ..core.turn import allocate_demand, clamp_capacity, menu_price_median
+from ..core.market import allocate_demand, clamp_capacity
+from ..rules.scoring import menu_price_median
 from foodops.ui.director_office import bureau_directeur  # garde ta signature actuelle
 from ..core.accounting import (
     month_amortization, post_sales, post_cogs, post_services_ext,
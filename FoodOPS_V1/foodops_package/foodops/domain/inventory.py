@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 # On importe la notion de gamme pour pouvoir prioriser “meilleure gamme d’abord”.
 try:
@@ -66,6 +66,25 @@ class FinishedBatch:
         return current_tour > self.expires_tour
 
 
+def _make_lot(
+    name: str,
+    grade: FoodGrade,
+    qty_kg: float,
+    unit_cost: float,
+    current_tour: int,
+    shelf_tours: int,
+) -> IngredientStockLot:
+    """Lot reçu à `current_tour`, consommable pendant `shelf_tours` tours."""
+    return IngredientStockLot(
+        name=name,
+        grade=grade,
+        qty_kg=float(qty_kg),
+        unit_cost=float(unit_cost),
+        received_tour=current_tour,
+        perish_tour=current_tour + int(max(0, shelf_tours)),
+    )
+
+
 # -------------------- Inventory principal --------------------
 
 @dataclass
@@ -93,16 +112,18 @@ class Inventory:
         Ajoute un lot d’ingrédient. La péremption est exprimée en nombre de tours.
         Par ex. shelf_tours=1 => consommable sur le tour courant seulement.
         """
-        lot = IngredientStockLot(
-            name=name,
-            grade=grade,
-            qty_kg=float(qty_kg),
-            unit_cost=float(unit_cost),
-            received_tour=current_tour,
-            perish_tour=current_tour + int(max(0, shelf_tours)),
-        )
+        lot = _make_lot(name, grade, qty_kg, unit_cost, current_tour, shelf_tours)
         self.raw.setdefault(name, []).append(lot)
 
+    def bulk_seed(self, rows: Iterable[Tuple[str, FoodGrade, float, float, int, int]]) -> None:
+        """
+        Ajoute plusieurs lots d’un coup (mise en place, démos).
+        rows : (name, grade, qty_kg, unit_cost, current_tour, shelf_tours), mêmes règles que add_ingredient.
+        """
+        setdefault = self.raw.setdefault
+        for row in rows:
+            setdefault(row[0], []).append(_make_lot(*row))
+
     def get_available_qty(self, name: str, current_tour: Optional[int] = None) -> float:
         """
         Quantité totale dispo (kg) non périmée pour un ingrédient.
@@ -178,6 +199,25 @@ class Inventory:
 
         return (round(taken, 6), round(cost, 2))
 
+    def bulk_consume(
+        self,
+        needs: Iterable[Tuple[str, float]],
+        current_tour: Optional[int] = None,
+        factor: float = 1.0,
+    ) -> Tuple[float, float]:
+        """
+        Consomme une liste de besoins [(name, qty_kg)] multipliés par `factor`
+        (ex. nombre de portions). Retourne (qty_totale_retirée, coût_total).
+        """
+        consume = self.consume_ingredient
+        taken = 0.0
+        cost = 0.0
+        for name, qty in needs:
+            t, c = consume(name, qty * factor, current_tour)
+            taken += t
+            cost += c
+        return (round(taken, 6), round(cost, 2))
+
     # -------- Produits finis (production / vente / nettoyage) --------
 
     def add_finished_lot(
@@ -220,26 +260,30 @@ class Inventory:
         NB : certaines UIs préféreront choisir une recette précise — cette
         méthode globale est utile quand on “sert” des clients sans granularité.
         """
+        finished = self.finished
         need = int(qty_portions)
         sold = 0
         revenue = 0.0
         i = 0
-        while i < len(self.finished) and need > 0:
-            b = self.finished[i]
-            if b.portions <= 0:
-                self.finished.pop(i)
-                continue
-            take = min(b.portions, need)
-            if take > 0:
-                sold += take
-                revenue += take * b.selling_price
-                b.portions -= take
-                need -= take
-
-            if b.portions <= 0:
-                self.finished.pop(i)
-            else:
-                i += 1
+        n = len(finished)
+        # Les lots vidés forment toujours un préfixe : on avance, puis on les retire en une fois
+        while i < n and need > 0:
+            b = finished[i]
+            p = b.portions
+            if p > need:
+                # dernier lot touché, partiellement entamé : il reste en tête
+                b.portions = p - need
+                sold += need
+                revenue += need * b.selling_price
+                need = 0
+                break
+            if p > 0:
+                sold += p
+                revenue += p * b.selling_price
+                need -= p
+                b.portions = 0
+            i += 1
+        del finished[:i]
         return (sold, round(revenue, 2))
 
     # -------- Nettoyage (péremption) --------
@@ -38,6 +38,22 @@ class Recipe:
     selling_price: float = 0.0  # le joueur peut forcer; sinon on proposera via policy
     base_quality: float = 0.0   # on calcule une qualité de base (0..1) à partir des grades
 
+    # Valeurs dérivées mémorisées (coût/portion, qualité, prix conseillé par politique),
+    # valides tant que l'instantané des entrées (_derived_key) n'a pas changé
+    _derived: Dict[object, float] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _derived_key: tuple = field(default=(), init=False, repr=False, compare=False)
+
+    def _derived_cache(self) -> Dict[object, float]:
+        """
+        Cache des valeurs dérivées, vidé si rendement, lignes, quantités ou
+        ingrédients (prix, gamme) ont changé, y compris par une modif en place.
+        """
+        key = (self.yield_portions, tuple((line.qty_g, line.ingredient) for line in self.lines))
+        if key != self._derived_key:
+            self._derived.clear()
+            self._derived_key = key
+        return self._derived
+
     # --------- COÛTS ---------
     def raw_cost(self, price_overrides: Dict[str, float] | None = None) -> float:
         """Coût total matières (quantités brutes)."""
@@ -47,15 +63,25 @@ class Recipe:
         """Coût matières / portion en tenant compte du rendement."""
         if self.yield_portions <= 0:
             return 0.0
-        total_cost = self.raw_cost(price_overrides)
-        # V1 simple : on répartit le coût matières sur le nombre de portions annoncé
-        return total_cost / self.yield_portions
+        if price_overrides is not None:
+            # V1 simple : on répartit le coût matières sur le nombre de portions annoncé
+            return self.raw_cost(price_overrides) / self.yield_portions
+        derived = self._derived_cache()
+        cost = derived.get("cost_pp")
+        if cost is None:
+            cost = derived["cost_pp"] = self.raw_cost() / self.yield_portions
+        return cost
 
     # --------- QUALITÉ ---------
     def estimate_quality(self) -> float:
         """Qualité perçue (0..1) selon les grades + pénalités/pertes (V1 : moyenne pondérée simple)."""
         if not self.lines:
             return 0.0
+        derived = self._derived_cache()
+        q = derived.get("quality")
+        if q is not None:
+            self.base_quality = q
+            return q
         weights = []
         vals = []
         for line in self.lines:
@@ -63,11 +89,16 @@ class Recipe:
             vals.append(g_weight)
             weights.append(max(1.0, line.qty_g))  # pondération par masse
         q = sum(v * w for v, w in zip(vals, weights)) / sum(weights)
+        derived["quality"] = q
         self.base_quality = q
         return q
 
     # --------- PRIX CONSEILLÉ ---------
     def suggest_price(self, policy: costing.PricePolicy) -> float:
         """Prix conseillé FR en fonction d’une politique type (fast/bistro/gastro)."""
-        cm = self.cost_per_portion()
-        return costing.suggest_price(cm, policy)
+        derived = self._derived_cache()
+        key = ("price", policy)
+        price = derived.get(key)
+        if price is None:
+            price = derived[key] = costing.suggest_price(self.cost_per_portion(), policy)
+        return price
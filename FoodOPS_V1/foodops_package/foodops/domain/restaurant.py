@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 from .types import RestaurantType
 from .inventory import Inventory
@@ -8,6 +8,18 @@ from .staff import Employe, Role
 
 if TYPE_CHECKING:
     from .staff import Employe  # hints only
+
+@dataclass(frozen=True, slots=True)
+class MenuArrays:
+    """
+    Menu en “structure de tableaux” : prix, qualité de base et GradeKey des recettes,
+    index par index. Reconstruit par rules.scoring.menu_arrays à chaque version du menu.
+    """
+    prices: Tuple[float, ...] = ()
+    qualities: Tuple[float, ...] = ()
+    grade_keys: Tuple[int, ...] = ()
+
+
 @dataclass
 class Restaurant:
     name: str
@@ -16,6 +28,7 @@ class Restaurant:
     notoriety: float = 0.5
     equipe: List["Employe"] = field(default_factory=list)
     marketing_budget: float = 0.0
+    # Ajouter via add_recipe_to_menu ; toute autre modif (append, set_price…) → touch_menu()
     menu: List[SimpleRecipe] = field(default_factory=list)
     funds: float = 0.0
     ledger: Optional[object] = None
@@ -31,10 +44,42 @@ class Restaurant:
     turn_cogs: float = 0.0
     service_minutes_left: int = 0
     kitchen_minutes_left: int = 0
+    rh_satisfaction: Optional[float] = None  # None tant que non mesurée (pas d'impact scoring)
+
+    # Caches de scoring (vues colonnes du menu, qualité moyenne, prix médian, score partiel), valides pour une version du menu
+    _menu_version: int = field(default=0, init=False, repr=False, compare=False)
+    _menu_arrays: Optional[MenuArrays] = field(default=None, init=False, repr=False, compare=False)
+    _menu_arrays_version: int = field(default=-1, init=False, repr=False, compare=False)
+    _cached_qmean: float = field(default=0.0, init=False, repr=False, compare=False)
+    _cached_qmean_version: int = field(default=-1, init=False, repr=False, compare=False)
+    _cached_price_median: float = field(default=0.0, init=False, repr=False, compare=False)
+    _cached_price_median_version: int = field(default=-1, init=False, repr=False, compare=False)
+    _cached_partial: tuple = field(default=(0.0, 0.0), init=False, repr=False, compare=False)
+    _cached_partial_version: int = field(default=-1, init=False, repr=False, compare=False)
+    # Noms des recettes du menu (dédoublonnage en O(1)), même invalidation par version
+    _menu_names: set = field(default_factory=set, init=False, repr=False, compare=False)
+    _menu_names_version: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def touch_menu(self) -> None:
+        """
+        Invalide les caches de scoring. Le scoring dépend de menu, type, local,
+        notoriety et rh_satisfaction : toute modif de ces champs après le premier
+        scoring (réaffectation, menu.append, set_price sur une recette du menu,
+        visibilité du local…) doit être suivie d'un appel. Les mutateurs du
+        moteur (add_recipe_to_menu, update_rh_satisfaction, érosion de notoriété,
+        marketing) le font déjà.
+        """
+        self._menu_version += 1
 
     def add_recipe_to_menu(self, recipe: SimpleRecipe) -> None:
-        if all(r.name != recipe.name for r in self.menu):
+        names = self._menu_names
+        if self._menu_names_version != self._menu_version:
+            names = self._menu_names = {r.name for r in self.menu}
+        if recipe.name not in names:
             self.menu.append(recipe)
+            names.add(recipe.name)
+            self.touch_menu()
+        self._menu_names_version = self._menu_version
 
     def reset_rh_minutes(self) -> None:
         total_service = 0
@@ -70,7 +115,9 @@ class Restaurant:
             delta = +0.01
         else:
             delta = +0.02
-        self.rh_satisfaction = max(0.0, min(1.0, getattr(self, "rh_satisfaction", 0.8) + delta))
+        current = 0.8 if self.rh_satisfaction is None else self.rh_satisfaction
+        self.rh_satisfaction = max(0.0, min(1.0, current + delta))
+        self.touch_menu()
 
     def _resolve_recipe_needs(self, recipe: SimpleRecipe) -> list:
         """Retourne la liste des besoins ingrédients [(name, qty_kg)] pour une recette."""
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from typing import Optional
 
 # === Ajout pour compatibilité menus_presets_simple ===
@@ -17,7 +17,52 @@ class Complexity(str, Enum):
     SIMPLE = "simple"
     COMPLEXE = "complexe"
 
-@dataclass
+
+class GradeKey(IntEnum):
+    """Gamme normalisée pour le scoring (= index de colonne des tables de pénalité)."""
+    G1 = 0    # frais
+    G3 = 1    # surgelé
+    G5 = 2    # sous-vide
+    UNK = 3   # indéterminé
+
+
+# Champs potentiels portant un hint de gamme, par ordre de priorité
+_GRADE_HINT_ATTRS = ("grade_hint", "grade_tag", "grade", "food_grade", "ing_grade")
+
+
+def _grade_hint(recipe) -> Optional[str]:
+    """
+    Retourne un hint de “gamme ingrédient” si disponible.
+    Ex. 'G1','G3','G5' ou 'fresh','frozen','sousvide'. None si indéterminé.
+    """
+    for attr in _GRADE_HINT_ATTRS:
+        v = getattr(recipe, attr, None)
+        if v is None:
+            continue
+        if isinstance(v, str):
+            return v.upper()
+        if isinstance(v, Enum):
+            return v.name.upper()
+        return str(v).upper()
+    return None
+
+
+def grade_key_of(recipe) -> GradeKey:
+    """
+    Normalise le hint de gamme d'une recette (quel que soit son type) en GradeKey.
+    Coûteux (getattr/str) : appelé à la reconstruction des vues du menu (rules.scoring.menu_arrays), pas au scoring.
+    """
+    hint = _grade_hint(recipe)
+    if hint in ("FRESH", "FRAIS"):
+        return GradeKey.G1
+    if hint in ("FROZEN", "SURGELE", "SURGELÉ", "G3"):
+        return GradeKey.G3
+    if hint in ("SOUSVIDE", "SOUS_VIDE", "G5"):
+        return GradeKey.G5
+    return GradeKey.UNK
+
+
+@dataclass(slots=True)
 class SimpleRecipe:
     name: str
     # Deux formats acceptés
@@ -67,6 +112,7 @@ class SimpleRecipe:
         return float(self.price or self.selling_price or 0.0)
 
     def set_price(self, value):
+        # Si la recette est déjà au menu d'un Restaurant : appeler resto.touch_menu() ensuite
         v = float(value)
         self.price = v
         self.selling_price = v
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from ..data.ingredients import Ingredient, FoodGrade
@@ -22,6 +23,37 @@ class Inventory:
     ingredients: Dict[Tuple[str, FoodGrade], StockItem] = field(default_factory=dict)
     finished: List[FinishedBatch] = field(default_factory=list)
 
+    # Index des noms en stock, trié (tenu à jour à l'ajout / à l'épuisement d'une variante)
+    _names: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _variants_per_name: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for name, _grade in self.ingredients:
+            self._index_add(name)
+
+    # --- INDEX DES NOMS ---
+
+    def _index_add(self, name: str) -> None:
+        n = self._variants_per_name.get(name, 0)
+        self._variants_per_name[name] = n + 1
+        if n == 0:
+            insort(self._names, name)
+
+    def _index_remove(self, name: str) -> None:
+        n = self._variants_per_name.pop(name) - 1
+        if n:
+            self._variants_per_name[name] = n
+        else:
+            del self._names[bisect_left(self._names, name)]
+
+    def _drop(self, key: Tuple[str, FoodGrade]) -> None:
+        del self.ingredients[key]
+        self._index_remove(key[0])
+
+    def ingredient_names(self) -> List[str]:
+        """Noms d'ingrédients en stock (toutes gammes confondues), triés. Ne pas modifier."""
+        return self._names
+
     # --- INGREDIENTS ---
 
     def add_ingredient(self, ing: Ingredient, kg: float) -> None:
@@ -31,6 +63,7 @@ class Inventory:
             cur.kg += kg
         else:
             self.ingredients[key] = StockItem(ingredient=ing, kg=kg)
+            self._index_add(ing.name)
 
     def get_available_variants(self, name: str) -> List[StockItem]:
         return [si for (n, _), si in self.ingredients.items() if n == name and si.kg > 0.0001]
@@ -42,7 +75,7 @@ class Inventory:
             return False
         si.kg -= kg
         if si.kg <= 1e-6:
-            del self.ingredients[key]
+            self._drop(key)
         return True
 
     # --- PRODUITS FINIS ---
@@ -91,7 +124,7 @@ class Inventory:
         # Déduire du stock
         si.kg -= kg_needed
         if si.kg <= 1e-6:
-            del self.ingredients[key]
+            self._drop(key)
 
         # Créer un lot de produits finis périmant fin du tour suivant
         batch = FinishedBatch(
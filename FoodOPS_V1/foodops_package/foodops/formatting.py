@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# foodops/formatting.py
+"""
+Formatage des montants en euros, partagé par l'UI et le setup.
+Un seul jeu de fonctions pour tout le jeu.
+"""
+from functools import lru_cache
+from math import isfinite
+
+
+@lru_cache(maxsize=1024)
+def group_thousands(n: int) -> str:
+    """Entier groupé par milliers avec des espaces : -12 345."""
+    # Groupes de 3 chiffres construits directement (pas de format "," puis replace)
+    neg = "-" if n < 0 else ""
+    s = str(abs(n))
+    parts = []
+    while len(s) > 3:
+        parts.append(s[-3:])
+        s = s[:-3]
+    parts.append(s)
+    return neg + " ".join(reversed(parts))
+
+
+def fmt_eur(x: float) -> str:
+    """Montant arrondi à l'euro : 12 345 €."""
+    if not isfinite(x):
+        # nan / inf : pas d'entier à grouper, rendu historique ("nan €", "inf €")
+        return f"{x:,.0f} €"
+    return group_thousands(int(round(x))) + " €"
+
+
+def fmt_eur_cents(x: float) -> str:
+    """Montant au centime, virgule décimale : 12 345,67 €."""
+    # Pas de cache : lru_cache hacherait l'argument avant le try (TypeError sur un
+    # non-hachable) et la conversion coûte moins qu'une consultation du cache.
+    try:
+        v = float(x)
+    except Exception:
+        return f"{x} €"
+    if not isfinite(v):
+        # nan / inf : rien à grouper ("nan €", "inf €")
+        return f"{v} €"
+    # Arrondi au centime par le format (exact, signe de -0.0 compris), partie entière groupée
+    euros, cents = f"{v:.2f}".split(".")
+    sign = "-" if euros[0] == "-" else ""
+    return f"{sign}{group_thousands(abs(int(euros)))},{cents} €"
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# foodops/parsing.py
+"""
+Lecture des saisies numériques, partagée par l'UI et le setup.
+Le format est vérifié par regex avant conversion : une saisie invalide
+renvoie None, sans passer par une exception.
+"""
+import re
+from typing import Optional
+
+# Entier signé, espaces autour tolérés
+_INT_RE = re.compile(r"\s*[-+]?\d+\s*")
+# Décimal signé, point ou virgule décimale (ex. "12", "0,16", ".5")
+_FLOAT_RE = re.compile(r"\s*[-+]?(?:\d+(?:[.,]\d*)?|[.,]\d+)\s*")
+
+
+def parse_int(s: str) -> Optional[int]:
+    """Entier saisi, ou None si `s` n'en est pas un."""
+    return int(s) if _INT_RE.fullmatch(s) else None
+
+
+def parse_float(s: str) -> Optional[float]:
+    """Nombre décimal saisi (virgule acceptée), ou None si `s` n'en est pas un."""
+    return float(s.replace(",", ".")) if _FLOAT_RE.fullmatch(s) else None
@@ -1,3 +1,3 @@
 """Rules and scoring"""
-from .scoring import SCORING_WEIGHTS, attraction_score
-__all__ = ["SCORING_WEIGHTS", "attraction_score"]
+from .scoring import SCORING_WEIGHTS, attraction_score, attraction_matrix
+__all__ = ["SCORING_WEIGHTS", "attraction_score", "attraction_matrix"]
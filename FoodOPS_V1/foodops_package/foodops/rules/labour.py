@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 # foodops/rules/labour.py
 
+from functools import lru_cache
+
 from ..domain.simple_recipe import Technique, Complexity
 
 # minutes/portion (base) par technique
@@ -19,7 +21,12 @@ CPLX_MULT = {
     Complexity.COMPLEXE: 1.3,
 }
 
-def recipe_prep_minutes_per_portion(recipe) -> float:
-    base = TECH_MIN_PER_PORTION.get(recipe.technique, 4.0)
-    mult = CPLX_MULT.get(recipe.complexity, 1.0)
+@lru_cache(maxsize=64)
+def _prep_minutes(technique, complexity) -> float:
+    """Minutes/portion pour un couple (technique, complexité) : ne dépend que de ces deux clés."""
+    base = TECH_MIN_PER_PORTION.get(technique, 4.0)
+    mult = CPLX_MULT.get(complexity, 1.0)
     return base * mult
+
+def recipe_prep_minutes_per_portion(recipe) -> float:
+    return _prep_minutes(recipe.technique, recipe.complexity)
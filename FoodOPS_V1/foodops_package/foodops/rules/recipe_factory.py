@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 # foodops/rules/recipes_factory.py
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple, Dict
 import random
 
@@ -168,17 +169,22 @@ def _gen_combo(a: CatalogItem, b: CatalogItem, rtype: RestaurantType) -> SimpleR
         price=price,
     )
 
+# cible de longueur de menu selon type
+_MENU_TARGET = {
+    RestaurantType.FAST_FOOD: 10,
+    RestaurantType.BISTRO: 15,
+    RestaurantType.GASTRO: 20,
+}
+
+@lru_cache(maxsize=8)
+def _available_items(rtype: RestaurantType) -> Tuple[CatalogItem, ...]:
+    # filtre catalogue selon tier d’accès (statique) ; le tirage aléatoire reste par appel
+    return tuple(it for it in CATALOG.values() if _allowed_for_type(it, rtype))
+
 def build_menu_for_type(rtype: RestaurantType) -> List[SimpleRecipe]:
-    # cible de longueur de menu selon type
-    targets = {
-        RestaurantType.FAST_FOOD: 10,
-        RestaurantType.BISTRO: 15,
-        RestaurantType.GASTRO: 20,
-    }
-    target = targets[rtype]
-
-    # filtre catalogue selon tier d’accès
-    avail = [it for it in CATALOG.values() if _allowed_for_type(it, rtype)]
+    target = _MENU_TARGET[rtype]
+
+    avail = list(_available_items(rtype))
     random.shuffle(avail)
 
     # 1) simples
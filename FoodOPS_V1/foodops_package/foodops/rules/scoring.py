@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # foodops/rules/scoring.py
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Sequence, Tuple
 
 # Import souples (le module doit rester robuste même si certaines parties évoluent)
 try:
@@ -9,14 +9,10 @@ try:
 except Exception:
     ProfilClient = object  # fallback type
 
-try:
-    from ..domain import Restaurant, RestaurantType
-except Exception:
-    Restaurant = object
-    class RestaurantType:  # fallback minimal
-        FAST_FOOD = type("E", (), {"value": "Fast Food"})
-        BISTRO = type("E", (), {"value": "Bistrot"})
-        GASTRO = type("E", (), {"value": "Gastronomique"})
+# Imports stricts : le scoring lit directement les caches de Restaurant et les GradeKey
+from ..domain import Restaurant, RestaurantType
+from ..domain.restaurant import MenuArrays
+from ..domain.simple_recipe import SimpleRecipe, grade_key_of
 
 
 # ==========================
@@ -30,20 +26,24 @@ SCORING_WEIGHTS: Dict[str, float] = {
     "visibilite": 0.10,  # emplacement/visibilité du local
 }
 
+# Poids “à plat” pour le chemin chaud (pas de lookup dict à chaque score)
+_W_FIT, _W_PRIX, _W_QUAL, _W_NOTO, _W_VIS = (
+    SCORING_WEIGHTS[k] for k in ("fit", "prix", "qualite", "notoriete", "visibilite")
+)
+
 
 # ==========================
 # Petits helpers génériques
 # ==========================
 
-def _median(values: List[float]) -> float:
-    s = sorted(values)
-    n = len(s)
+def _median(values: Sequence[float]) -> float:
+    """Médiane par tri (menus courts : plus rapide que statistics/numpy)."""
+    n = len(values)
     if n == 0:
         return 0.0
-    mid = n // 2
-    if n % 2 == 1:
-        return float(s[mid])
-    return 0.5 * (float(s[mid - 1]) + float(s[mid]))
+    s = sorted(values)
+    mid = n >> 1
+    return s[mid] if n & 1 else 0.5 * (s[mid - 1] + s[mid])
 
 
 def _get_price(item) -> float:
@@ -68,9 +68,16 @@ def _clamp01(x: float) -> float:
 # =====================================================
 
 def menu_price_median(resto: Restaurant) -> float:
-    menu = getattr(resto, "menu", None) or []
-    vals = [_get_price(r) for r in menu if r is not None]
-    return _median(vals) if vals else 0.0
+    """Prix médian, mis en cache sur le restaurant tant que son menu n'a pas changé."""
+    version = resto._menu_version
+    if resto._cached_price_median_version == version:
+        return resto._cached_price_median
+
+    price = _median(menu_prices(resto))
+
+    resto._cached_price_median = price
+    resto._cached_price_median_version = version
+    return price
 
 
 # =====================================================
@@ -82,9 +89,12 @@ def menu_price_median(resto: Restaurant) -> float:
 
 def _recipe_quality_base(recipe) -> float:
     """
-    Essaye plusieurs noms de champs usuels pour la qualité intrinsèque d'une recette.
-    Valeur attendue dans [0..1]. Par défaut 0.6 (correct).
+    Qualité intrinsèque d'une recette, dans [0..1].
+    SimpleRecipe : accès direct à base_quality. Autres objets : essaye plusieurs
+    noms de champs usuels. Par défaut 0.6 (correct).
     """
+    if isinstance(recipe, SimpleRecipe):
+        return _clamp01(recipe.base_quality)
     for attr in ("quality", "base_quality", "quality_base", "q_base"):
         val = getattr(recipe, attr, None)
         if val is not None:
@@ -95,99 +105,87 @@ def _recipe_quality_base(recipe) -> float:
     return 0.60
 
 
-def _recipe_grade_hint(recipe) -> Optional[str]:
-    """
-    Retourne un hint de “gamme ingrédient” si disponible.
-    Ex. 'G1','G3','G5' ou 'fresh','frozen','sousvide'. None si indéterminé.
-    """
-    # Essais souples de champs potentiels
-    for attr in ("grade_hint", "grade_tag", "grade", "food_grade", "ing_grade"):
-        v = getattr(recipe, attr, None)
-        if v is None:
-            continue
-        # Enum -> str
-        if hasattr(v, "name"):
-            return v.name.upper()
-        if hasattr(v, "value"):
-            try:
-                return str(v.value).upper()
-            except Exception:
-                return str(v)
-        try:
-            return str(v).upper()
-        except Exception:
-            pass
-    return None
-
-
 # Attente de “prestige” par type de restaurant : pénalités si la recette paraît “trop simple”
-# Les valeurs sont multipliées (1.0 = neutre, <1 = malus)
-_CONCEPT_EXPECTATION_PENALTY = {
-    "Fast Food": {
-        "G5": 0.95,  # trop “haut de gamme” n'apporte pas grand-chose ici (neutre-)
-        "G1": 1.00,  # très bien si frais
-        "G3": 0.95,  # surgelé OK
-        None: 0.98,
-    },
-    "Bistrot": {
-        "G5": 0.98,  # 5ème gamme OK si bien exécuté
-        "G1": 1.00,  # frais cohérent
-        "G3": 0.95,  # surgelé léger malus
-        None: 0.98,
-    },
-    "Gastronomique": {
-        "G5": 1.00,  # du sous-vide haute qualité peut être OK en gastro
-        "G1": 1.00,  # frais attendu
-        "G3": 0.85,  # surgelé mal vu en gastro
-        None: 0.92,  # indéterminé : petit malus par prudence
-    },
+# Les valeurs sont multipliées (1.0 = neutre, <1 = malus), indexées par GradeKey :
+#                              G1 (frais)  G3 (surgelé)  G5 (sous-vide)  UNK (indéterminé)
+_PENALTY: Dict[RestaurantType, Tuple[float, float, float, float]] = {
+    RestaurantType.FAST_FOOD: (1.00,       0.95,         0.95,           0.98),  # haut de gamme inutile ici
+    RestaurantType.BISTRO:    (1.00,       0.95,         0.98,           0.98),  # 5ème gamme OK si bien exécuté
+    RestaurantType.GASTRO:    (1.00,       0.85,         1.00,           0.92),  # surgelé mal vu en gastro
 }
+# Multiplicateurs dans [0..1] : la moyenne pondérée reste dans [0..1] sans re-borner
+assert all(0.0 <= v <= 1.0 for row in _PENALTY.values() for v in row), "_PENALTY hors [0..1]"
+
+
+def _concept_of(resto: Restaurant) -> RestaurantType:
+    """Concept du restaurant (membre de l'enum) ; BISTRO si non renseigné."""
+    t = resto.type
+    return t if t in _PENALTY else RestaurantType.BISTRO
 
 
-def _apply_concept_quality_adjust(resto: Restaurant, q: float, recipe) -> float:
+# =====================================================
+# Vues “colonnes” du menu (prix, qualités, gammes)
+# =====================================================
+
+def menu_arrays(resto: Restaurant) -> MenuArrays:
     """
-    Ajuste la qualité d'une recette selon les attentes du concept.
-    Ex: surgelé en gastro → malus.
+    Prix, qualités de base et GradeKey des items du menu, en tableaux parallèles.
+    Extraits une seule fois par version du menu : les calculs de scoring relisent
+    ces tuples au lieu de refaire trois lectures d'attributs par recette.
     """
-    concept = getattr(getattr(resto, "type", None), "value", None) or getattr(resto, "type", "Bistrot")
-    concept = str(concept)
-    table = _CONCEPT_EXPECTATION_PENALTY.get(concept, _CONCEPT_EXPECTATION_PENALTY["Bistrot"])
-    hint = _recipe_grade_hint(recipe)
+    version = resto._menu_version
+    if resto._menu_arrays_version == version:
+        return resto._menu_arrays
+
+    items = [it for it in resto.menu if it is not None]
+    arrays = MenuArrays(
+        prices=tuple(_get_price(it) for it in items),
+        qualities=tuple(_recipe_quality_base(it) for it in items),
+        grade_keys=tuple(grade_key_of(it) for it in items),
+    )
+
+    resto._menu_arrays = arrays
+    resto._menu_arrays_version = version
+    return arrays
 
-    # Normalise certains mots-clés
-    if hint in ("FRESH", "FRAIS"):
-        hint_norm = "G1"
-    elif hint in ("FROZEN", "SURGELE", "SURGELÉ", "G3"):
-        hint_norm = "G3"
-    elif hint in ("SOUSVIDE", "SOUS_VIDE", "G5"):
-        hint_norm = "G5"
-    else:
-        hint_norm = None
 
-    mult = table.get(hint_norm, table.get(None, 1.0))
-    return _clamp01(q * float(mult))
+def menu_prices(resto: Restaurant) -> Tuple[float, ...]:
+    """Prix de vente des items du menu (ordre du menu)."""
+    return menu_arrays(resto).prices
 
 
 def menu_quality_mean(resto: Restaurant) -> float:
     """
     Qualité perçue moyenne du menu (0..1), ajustée par concept et satisfaction RH.
+    La ligne de pénalité du concept est résolue une seule fois pour tout le menu,
+    et le résultat est mis en cache sur le restaurant (cf. Restaurant.touch_menu).
     """
-    menu = getattr(resto, "menu", None) or []
-    if not menu:
-        return 0.0
+    version = resto._menu_version
+    if resto._cached_qmean_version == version:
+        return resto._cached_qmean
 
-    qualities = []
-    for it in menu:
-        q = _recipe_quality_base(it)
-        q = _apply_concept_quality_adjust(resto, q, it)
-        qualities.append(q)
+    qmean = _menu_quality_mean(resto)
 
-    qmean = sum(qualities) / max(1, len(qualities))
+    resto._cached_qmean = qmean
+    resto._cached_qmean_version = version
+    return qmean
+
+
+def _menu_quality_mean(resto: Restaurant) -> float:
+    arrays = menu_arrays(resto)
+    qualities = arrays.qualities
+    if not qualities:
+        return 0.0
+
+    row = _PENALTY[_concept_of(resto)]
+    # Qualités bornées × multiplicateurs dans [0..1] : moyenne déjà dans [0..1]
+    total = sum(q * row[k] for q, k in zip(qualities, arrays.grade_keys))
+    qmean = total / len(qualities)
 
     # Impact satisfaction RH (optionnel)
-    rh_sat = getattr(resto, "rh_satisfaction", None)
+    rh_sat = resto.rh_satisfaction
     if rh_sat is not None:
-        qmean = _clamp01(qmean * _clamp01(float(rh_sat)))
+        qmean *= _clamp01(rh_sat)
 
     return qmean
 
@@ -198,15 +196,10 @@ def menu_quality_mean(resto: Restaurant) -> float:
 
 def price_fit(price: float, budget_moyen: float) -> float:
     """
-    1.0 si <= budget; décroissance linéaire si au-dessus.
+    1.0 si <= budget; décroissance linéaire si au-dessus (0 à 2× le budget).
+    Sans branche sur le prix : 1 - max(0, p/b - 1), borné, = min(1, 2 - p/b) borné à 0.
     """
-    if budget_moyen <= 0:
-        return 0.0
-    if price <= budget_moyen:
-        return 1.0
-    gap = (price - budget_moyen) / budget_moyen
-    val = 1.0 - max(0.0, gap)
-    return _clamp01(val)
+    return 0.0 if budget_moyen <= 0 else max(0.0, min(1.0, 2.0 - price / budget_moyen))
 
 
 # =====================================================
@@ -214,17 +207,30 @@ def price_fit(price: float, budget_moyen: float) -> float:
 # =====================================================
 
 # Matrice concept ↔ segment (fit structurel)
-_CONCEPT_FIT = {
-    "Fast Food": {
+_CONCEPT_FIT: Dict[RestaurantType, Dict[str, float]] = {
+    RestaurantType.FAST_FOOD: {
         "étudiant": 0.90, "actif": 0.60, "famille": 0.60, "touriste": 0.50, "senior": 0.40
     },
-    "Bistrot": {
+    RestaurantType.BISTRO: {
         "étudiant": 0.60, "actif": 0.80, "famille": 0.75, "touriste": 0.70, "senior": 0.70
     },
-    "Gastronomique": {
+    RestaurantType.GASTRO: {
         "étudiant": 0.30, "actif": 0.60, "famille": 0.70, "touriste": 0.85, "senior": 0.80
     },
 }
+_FIT_UNKNOWN_SEGMENT = 0.6
+
+# Même matrice en table dense : _FIT_TABLE[_TYPE_INDEX[concept]][_SEGMENT_INDEX[segment]].
+# La dernière colonne sert aux segments inconnus.
+_SEGMENTS: Tuple[str, ...] = ("étudiant", "actif", "famille", "touriste", "senior")
+_SEGMENT_INDEX: Dict[str, int] = {seg: j for j, seg in enumerate(_SEGMENTS)}
+_SEG_UNKNOWN = len(_SEGMENTS)
+_TYPE_INDEX: Dict[RestaurantType, int] = {t: i for i, t in enumerate(_CONCEPT_FIT)}
+_FIT_TABLE: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(row.get(seg, _FIT_UNKNOWN_SEGMENT) for seg in _SEGMENTS) + (_FIT_UNKNOWN_SEGMENT,)
+    for row in _CONCEPT_FIT.values()
+)
+assert all(0.0 <= v <= 1.0 for row in _FIT_TABLE for v in row), "_CONCEPT_FIT hors [0..1]"
 
 
 def _visibility_norm(resto: Restaurant) -> float:
@@ -232,14 +238,49 @@ def _visibility_norm(resto: Restaurant) -> float:
     Normalise la visibilité du local en [0..1].
     On suppose local.visibility ~ 0..5 (adapter si autre échelle).
     """
-    local = getattr(resto, "local", None)
-    vis = getattr(local, "visibility", None)
-    if vis is None:
-        return 0.5
-    try:
-        return _clamp01(float(vis) / 5.0)
-    except Exception:
+    local = resto.local
+    if local is None:
         return 0.5
+    # NB : domain.Local n'expose que `visibilite` (autre échelle) → neutre
+    vis = getattr(local, "visibility", None)
+    return 0.5 if vis is None else _clamp01(vis / 5.0)
+
+
+def scoring_partial(resto: Restaurant) -> Tuple[float, float]:
+    """
+    Part du score d'attraction qui ne dépend que du restaurant (qualité, notoriété,
+    visibilité — déjà pondérées), et prix médian du menu. Mis en cache par version du menu :
+    pour S segments, ce travail n'est fait qu'une fois au lieu de S.
+    """
+    version = resto._menu_version
+    if resto._cached_partial_version == version:
+        return resto._cached_partial
+
+    # Qualité moyenne perçue, notoriété bornée, visibilité normalisée
+    partial = (
+        _W_QUAL * menu_quality_mean(resto) +
+        _W_NOTO * _clamp01(resto.notoriety) +
+        _W_VIS  * _visibility_norm(resto)
+    )
+    result = (partial, menu_price_median(resto))
+
+    resto._cached_partial = result
+    resto._cached_partial_version = version
+    return result
+
+
+def _fit_row(resto: Restaurant) -> Tuple[float, ...]:
+    """Ligne de _FIT_TABLE pour le concept du restaurant."""
+    return _FIT_TABLE[_TYPE_INDEX[_concept_of(resto)]]
+
+
+def _segment_index(seg: ProfilClient) -> int:
+    """Colonne de _FIT_TABLE pour le segment (clé de _SEGMENTS ; dernière colonne si inconnu)."""
+    return _SEGMENT_INDEX.get(seg.type_client, _SEG_UNKNOWN)
+
+
+def _segment_budget(seg: ProfilClient) -> float:
+    return seg.budget_moyen or 0.0
 
 
 def attraction_score(resto: Restaurant, seg: ProfilClient) -> float:
@@ -251,43 +292,57 @@ def attraction_score(resto: Restaurant, seg: ProfilClient) -> float:
       - qualité perçue (menu + RH + adéquation concept/gamme),
       - notoriété,
       - visibilité.
+    Seuls le fit et le prix dépendent du segment ; le reste vient de scoring_partial().
     """
-    # Prix médian du menu
-    price = menu_price_median(resto)
-    # Qualité moyenne perçue
-    qmean = menu_quality_mean(resto)
-    # Visibilité normalisée
-    vis = _visibility_norm(resto)
-    # Notoriété bornée
-    notoriety = _clamp01(float(getattr(resto, "notoriety", 0.5)))
+    partial, price = scoring_partial(resto)
 
     # Fit concept ↔ segment
-    concept = getattr(getattr(resto, "type", None), "value", None) or getattr(resto, "type", "Bistrot")
-    concept = str(concept)
-    seg_key = getattr(seg, "type_client", None)
-    seg_key = getattr(seg_key, "value", None) or getattr(seg_key, "name", None) or str(seg_key) or "actif"
-    fit = _CONCEPT_FIT.get(concept, _CONCEPT_FIT["Bistrot"]).get(seg_key, 0.6)
+    fit = _fit_row(resto)[_segment_index(seg)]
 
     # Adéquation prix ↔ budget segment
-    budget_moyen = float(getattr(seg, "budget_moyen", 0.0) or 0.0)
-    prix_ok = price_fit(price, budget_moyen)
-
-    attrs = {
-        "fit": fit,
-        "prix": prix_ok,
-        "qualite": qmean,
-        "notoriete": notoriety,
-        "visibilite": vis,
-    }
-
-    w = SCORING_WEIGHTS
-    score = (
-        w["fit"]        * attrs["fit"] +
-        w["prix"]       * attrs["prix"] +
-        w["qualite"]    * attrs["qualite"] +
-        w["notoriete"]  * attrs["notoriete"] +
-        w["visibilite"] * attrs["visibilite"]
-    )
+    prix_ok = price_fit(price, _segment_budget(seg))
+
+    score = partial + _W_FIT * fit + _W_PRIX * prix_ok
 
     # Garde bien le score borné
     return _clamp01(score)
+
+
+def _score_kernel(
+    partials: List[float],
+    prices: List[float],
+    fit_rows: List[Tuple[float, ...]],
+    seg_idx: List[int],
+    budgets: List[float],
+) -> List[List[float]]:
+    """
+    Noyau restaurants × segments sur des valeurs déjà extraites : poids et price_fit
+    inlinés, aucun appel de fonction ni accès attribut dans la double boucle.
+    """
+    w_fit, w_prix = _W_FIT, _W_PRIX
+    segs = list(zip(seg_idx, budgets))
+    matrix: List[List[float]] = []
+    for partial, price, fit_row in zip(partials, prices, fit_rows):
+        row: List[float] = []
+        for j, budget in segs:
+            prix_ok = 0.0 if budget <= 0 else max(0.0, min(1.0, 2.0 - price / budget))
+            score = partial + w_fit * fit_row[j] + w_prix * prix_ok
+            row.append(0.0 if score < 0.0 else 1.0 if score > 1.0 else score)
+        matrix.append(row)
+    return matrix
+
+
+def attraction_matrix(restaurants: List[Restaurant], segments: List[ProfilClient]) -> List[List[float]]:
+    """
+    Scores d'attraction de toutes les paires : M[i][j] = attraction_score(restaurants[i], segments[j]).
+    Le travail par restaurant (partiel, prix, ligne de fit) et par segment (clé, budget)
+    n'est fait qu'une fois ; seule la combinaison finale reste dans _score_kernel.
+    """
+    partials_prices = [scoring_partial(resto) for resto in restaurants]
+    return _score_kernel(
+        [pp[0] for pp in partials_prices],
+        [pp[1] for pp in partials_prices],
+        [_fit_row(resto) for resto in restaurants],
+        [_segment_index(seg) for seg in segments],
+        [_segment_budget(seg) for seg in segments],
+    )
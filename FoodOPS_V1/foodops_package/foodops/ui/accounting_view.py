@@ -1,35 +1,57 @@
 # foodops/ui/accounting_view.py
+import sys
+
+from ..formatting import fmt_eur_cents
+
+_SEP_EQ40 = "=" * 40
+_SEP_DASH40 = "-" * 40
+
 
 def _posneg(val):
-    """Affiche les valeurs positives sans signe, et les négatives avec un signe négatif."""
-    return f"{val:,.2f} €" if val >= 0 else f"-{abs(val):,.2f} €"
+    """Affiche les valeurs positives sans signe, et les négatives avec un signe négatif (nan/inf tolérés)."""
+    return fmt_eur_cents(val)
+
+
+# Lignes (préfixe affiché, clé) : le préfixe statique est construit une fois
+_IS_ROWS = (
+    ("  💶 Chiffre d'affaires (70) : ", "Chiffre d'affaires (70)"),
+    ("  🛒 Achats consommés (60) : ", "Achats consommés (60)"),
+    ("  🛠 Services extérieurs (61/62) : ", "Services extérieurs (61/62)"),
+    ("  👥 Charges de personnel (64) : ", "Charges de personnel (64)"),
+    ("  📉 Dotations amortissements (68) : ", "Dotations amortissements (68)"),
+)
+_IS_RESULT_ROW = ("  📈 Résultat d'exploitation : ", "Résultat d'exploitation")
+
+_BS_ACTIF_ROWS = (
+    ("  💰 Trésorerie : ", "Trésorerie"),
+    ("  📦 Stock : ", "Stock"),
+    ("  🏢 Immobilisations nettes : ", "Immobilisations nettes"),
+)
+_BS_PASSIF_ROWS = (
+    ("  🏦 Emprunts BPI : ", "Emprunts BPI"),
+    ("  🏦 Emprunts bancaires : ", "Emprunts bancaires"),
+    ("  📊 Capitaux propres : ", "Capitaux propres"),
+)
+_BS_CASH_ROWS = (
+    ("  💰 Trésorerie début : ", "Trésorerie début"),
+    ("  💰 Trésorerie fin : ", "Trésorerie fin"),
+)
 
 
 def print_income_statement(cr):
-    print("\n📊 Compte de Résultat (par tour)")
-    print("=" * 40)
-    print(f"  💶 Chiffre d'affaires (70) : {_posneg(cr['Chiffre d\'affaires (70)'])}")
-    print(f"  🛒 Achats consommés (60) : {_posneg(cr['Achats consommés (60)'])}")
-    print(f"  🛠 Services extérieurs (61/62) : {_posneg(cr['Services extérieurs (61/62)'])}")
-    print(f"  👥 Charges de personnel (64) : {_posneg(cr['Charges de personnel (64)'])}")
-    print(f"  📉 Dotations amortissements (68) : {_posneg(cr['Dotations amortissements (68)'])}")
-    print("-" * 40)
-    print(f"  📈 Résultat d'exploitation : {_posneg(cr['Résultat d\'exploitation'])}")
-    print("=" * 40)
+    prefix, key = _IS_RESULT_ROW
+    lines = ["\n📊 Compte de Résultat (par tour)", _SEP_EQ40]
+    lines += [p + _posneg(cr[k]) for p, k in _IS_ROWS]
+    lines += [_SEP_DASH40, prefix + _posneg(cr[key]), _SEP_EQ40]
+    # Un seul write pour tout l'état
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_balance_sheet(bs):
-    print("\n📒 Bilan")
-    print("=" * 40)
-    print("Actif :")
-    print(f"  💰 Trésorerie : {_posneg(bs['Trésorerie'])}")
-    print(f"  📦 Stock : {_posneg(bs['Stock'])}")
-    print(f"  🏢 Immobilisations nettes : {_posneg(bs['Immobilisations nettes'])}")
-    print("-" * 40)
-    print("Passif :")
-    print(f"  🏦 Emprunts BPI : {_posneg(bs['Emprunts BPI'])}")
-    print(f"  🏦 Emprunts bancaires : {_posneg(bs['Emprunts bancaires'])}")
-    print(f"  📊 Capitaux propres : {_posneg(bs['Capitaux propres'])}")
-    print("=" * 40)
-    print(f"  💰 Trésorerie début : {_posneg(bs['Trésorerie début'])}")
-    print(f"  💰 Trésorerie fin : {_posneg(bs['Trésorerie fin'])}")
\ No newline at end of file
+    lines = ["\n📒 Bilan", _SEP_EQ40, "Actif :"]
+    lines += [p + _posneg(bs[k]) for p, k in _BS_ACTIF_ROWS]
+    lines += [_SEP_DASH40, "Passif :"]
+    lines += [p + _posneg(bs[k]) for p, k in _BS_PASSIF_ROWS]
+    lines.append(_SEP_EQ40)
+    lines += [p + _posneg(bs[k]) for p, k in _BS_CASH_ROWS]
+    sys.stdout.write("\n".join(lines) + "\n")
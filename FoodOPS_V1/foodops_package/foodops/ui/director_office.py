@@ -1,23 +1,32 @@
 # foodops/ui/director_office.py
 # -*- coding: utf-8 -*-
-from typing import List, Dict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import List, Dict, Tuple
 import random
+import sys
 
-def _eur(x: float) -> str:
-    return f"{x:,.0f} €".replace(",", " ").replace(".0", "")
+from ..domain.staff import Employe, Role
+from ..formatting import fmt_eur
+from ..parsing import parse_float, parse_int
+
+
+# Montants à l'euro (formatage partagé et mis en cache)
+_eur = fmt_eur
+
+def _read_line(prompt: str) -> str:
+    # Lecture ligne à ligne (compatible parties scriptées / stdin redirigé) ; "" en fin de flux
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline().strip()
 
 def _prompt_float(prompt: str, default: float = 0.0) -> float:
-    try:
-        s = input(prompt).strip().replace(",", ".")
-        return float(s)
-    except Exception:
-        return default
+    v = parse_float(_read_line(prompt))
+    return default if v is None else v
 
 def _prompt_int(prompt: str, default: int = 0) -> int:
-    try:
-        return int(input(prompt).strip())
-    except Exception:
-        return default
+    v = parse_int(_read_line(prompt))
+    return default if v is None else v
 
 def _ensure_hr_fields(r):
     if not hasattr(r, "equipe"):
@@ -34,12 +43,8 @@ def _ensure_hr_fields(r):
         r.service_index = 0.6
 
 def _hr_cost_month(r) -> float:
-    # Somme brute simplifiée
-    total = 0.0
-    for emp in r.equipe:
-        total += getattr(emp, "salaire_mensuel", 0.0)
-    # Ajustement global
-    total *= (1.0 + getattr(r, "hr_salary_delta", 0.0))
+    # Somme brute simplifiée, puis ajustement global (champ garanti par _ensure_hr_fields)
+    total = sum(emp.salaire_total for emp in r.equipe) * (1.0 + r.hr_salary_delta)
     return round(total, 2)
 
 def _show_team(r):
@@ -48,36 +53,33 @@ def _show_team(r):
         print("(vide)")
     else:
         for i, emp in enumerate(r.equipe, 1):
-            sal = getattr(emp, "salaire_mensuel", 0.0)
-            print(f"{i}. {emp.nom} {emp.prenom} - {emp.poste} - {_eur(sal)}")
+            print(f"{i}. {emp.nom} - {emp.role.name.capitalize()} - {_eur(emp.salaire_total)}")
     print("-" * 23)
     print(f"Coût mensuel: {_eur(_hr_cost_month(r))}")
 
 # ——— Actions ———
 
+# Faux vivier minimaliste (construit une fois ; une embauche crée un domain.staff.Employe)
+_CANDIDATE_POOL: Tuple[Dict[str, object], ...] = (
+    {"nom": "Alex", "prenom": "Roux", "poste": "Équipier polyvalent", "role": Role.SERVEUR, "salaire_mensuel": 1550},
+    {"nom": "Marie", "prenom": "Lefevre", "poste": "Serveur", "role": Role.SERVEUR, "salaire_mensuel": 1650},
+    {"nom": "Karim", "prenom": "Garcia", "poste": "Manager", "role": Role.MANAGER, "salaire_mensuel": 2500},
+    {"nom": "Sophie", "prenom": "Bernard", "poste": "Plongeur", "role": Role.CUISINIER, "salaire_mensuel": 1500},
+    {"nom": "Lucas", "prenom": "Petit", "poste": "Cuisinier", "role": Role.CUISINIER, "salaire_mensuel": 1900},
+)
+
 def _action_recruter(r):
-    # Faux vivier minimaliste
-    pool = [
-        {"nom":"Alex","prenom":"Roux","poste":"Équipier polyvalent","salaire_mensuel":1550},
-        {"nom":"Marie","prenom":"Lefevre","poste":"Serveur","salaire_mensuel":1650},
-        {"nom":"Karim","prenom":"Garcia","poste":"Manager","salaire_mensuel":2500},
-        {"nom":"Sophie","prenom":"Bernard","poste":"Plongeur","salaire_mensuel":1500},
-        {"nom":"Lucas","prenom":"Petit","poste":"Cuisinier","salaire_mensuel":1900},
-    ]
-    for i, c in enumerate(pool, 1):
+    for i, c in enumerate(_CANDIDATE_POOL, 1):
         print(f"{i}. {c['nom']} {c['prenom']} - {c['poste']} - {_eur(c['salaire_mensuel'])}/mois")
     idx = _prompt_int("Sélectionnez un candidat: ", 0)
-    if 1 <= idx <= len(pool):
-        c = pool[idx-1]
+    if 1 <= idx <= len(_CANDIDATE_POOL):
+        c = _CANDIDATE_POOL[idx-1]
         prop = _prompt_float("Salaire proposé: ", c["salaire_mensuel"])
         # règle simple d’acceptation
         seuil = c["salaire_mensuel"] * 0.97
         if prop >= seuil:
-            # on enregistre l’employé
-            emp = type("Emp", (), {})()
-            emp.nom = c["nom"]; emp.prenom = c["prenom"]
-            emp.poste = c["poste"]; emp.salaire_mensuel = prop
-            r.equipe.append(emp)
+            # on enregistre l’employé au salaire négocié (même type que le reste de l'équipe)
+            r.equipe.append(Employe(nom=f"{c['nom']} {c['prenom']}", role=c["role"], salaire_total=prop))
             print("Embauche réussie!")
         else:
             print("Refusé.")
@@ -93,9 +95,9 @@ def _action_licencier(r):
     if 1 <= idx <= len(r.equipe):
         emp = r.equipe.pop(idx-1)
         # coût de licenciement simplifié
-        cout = getattr(emp, "salaire_mensuel", 0.0) * 0.5
+        cout = emp.salaire_total * 0.5
         r.funds -= cout
-        print(f"{emp.nom} {emp.prenom} licencié. Coût: {_eur(cout)}")
+        print(f"{emp.nom} licencié. Coût: {_eur(cout)}")
     else:
         print("Annulé.")
 
@@ -112,6 +114,7 @@ def _action_marketing(r):
     r.overheads["autres"] = r.overheads.get("autres", 0.0) + budget
     # Petit boost de notoriété plafonné
     r.notoriety = min(1.0, getattr(r, "notoriety", r.notoriety) + min(0.05, budget / 20000.0))
+    r.touch_menu()  # la notoriété entre dans le score d'attraction
     print(f"Marketing mensuel: {_eur(budget)} — Notoriété: {r.notoriety:.2f}")
 
 def _action_prix_menu(r):
@@ -140,64 +143,80 @@ def _action_formation_service(r):
 def _action_recap_rh(r):
     _show_team(r)
 
+# Choix du menu → action sur le resto (hors "6" Recettes & Achats et "0" Quitter)
+_ACTIONS = {
+    "1": _show_team,
+    "2": _action_recruter,
+    "3": _action_licencier,
+    "4": _action_ajuster_salaires,
+    "5": _action_marketing,
+    "7": _action_maintenance_qualite,
+    "8": _action_formation_service,
+    "9": _action_recap_rh,
+}
+
+_MENU = (
+    "\n=== Bureau du Directeur ===\n"
+    "1. Voir équipe\n"
+    "2. Recruter\n"
+    "3. Licencier\n"
+    "4. Ajuster salaires (global)\n"
+    "5. Budget marketing\n"
+    "6. Recettes & Achats\n"
+    "7. Maintenance / Qualité\n"
+    "8. Formation service\n"
+    "9. Récap RH\n"
+    "0. Quitter bureau\n"
+)
+
+@dataclass(slots=True)
+class _DummyResto:
+    """Resto minimal manipulé par le bureau quand aucun restaurant n'est injecté."""
+    equipe: list = field(default_factory=list)
+    funds: float = 0.0
+    notoriety: float = 0.5
+    overheads: dict = field(default_factory=lambda: {"autres": 0.0})
+    local: object = field(default_factory=lambda: SimpleNamespace(visibilite=1.0))
+    # champs RH posés par _ensure_hr_fields (déclarés : slots)
+    hr_salary_delta: float = 0.0
+    marketing_budget: float = 0.0
+    pricing_markup: float = 0.0
+    quality_index: float = 0.6
+    service_index: float = 0.6
+
+    def touch_menu(self) -> None:
+        """Pas de caches de scoring sur le resto de démo."""
+
 # ——— Entrée principale ———
 
 def bureau_directeur(equipe, type_resto, resto=None, current_tour=1):
     # si tu as accès à l'objet resto, passe-le directement (equipe restera dans resto)
     # r est injecté par game.py : on manipule l’objet directement
     # Ici, on retourne seulement l’équipe (back-compat de l’appel existant).
-    current_restaurant = getattr(bureau_directeur, "_r", None)
-    if current_restaurant is None:
-        # fallback si jamais on a besoin
-        class Dummy:
-            equipe = equipe_init or []
-            funds = 0.0
-            notoriety = 0.5
-            overheads = {"autres": 0.0}
-            local = type("L", (), {"visibilite":1.0})()
-        bureau_directeur._r = Dummy()
-    r = bureau_directeur._r
+    if resto is not None:
+        r = resto
+        if equipe is not None:
+            r.equipe = equipe
+    else:
+        # fallback : resto minimal propre à cet appel (jamais partagé entre restaurants)
+        r = _DummyResto(equipe=equipe if equipe is not None else [])
     _ensure_hr_fields(r)
 
     while True:
-        print("\n=== Bureau du Directeur ===")
-        print("1. Voir équipe")
-        print("2. Recruter")
-        print("3. Licencier")
-        print("4. Ajuster salaires (global)")
-        print("5. Budget marketing")
-        print("6. Politique de prix (markup)")
-        print("7. Maintenance / Qualité")
-        print("8. Formation service")
-        print("9. Récap RH")
-        print("0. Quitter bureau")
+        sys.stdout.write(_MENU)
         choice = input("> ").strip()
 
-        if choice == "1":
-            _show_team(r)
-        elif choice == "2":
-            _action_recruter(r)
-        elif choice == "3":
-            _action_licencier(r)
-        elif choice == "4":
-            _action_ajuster_salaires(r)
-        elif choice == "5":
-            _action_marketing(r)
-        
-        print("6. Recettes & Achats")
-        elif choice == "6":
+        if choice == "0":
+            break
+        if choice == "6":
+            # seule action qui a besoin du resto et du tour (pas de l'objet RH)
             from .director_recipes import run_recipes_shop
             run_recipes_shop(resto, current_tour)  # tu dois faire passer current_tour depuis game.py
-        elif choice == "7":
-            _action_maintenance_qualite(r)
-        elif choice == "8":
-            # Ajoute ici l'action pour le choix 8
-            pass
-        elif choice == "9":
-            _action_recap_rh(r)
-        elif choice == "0":
-            break
-        else:
+            continue
+        action = _ACTIONS.get(choice)
+        if action is None:
             print("Choix invalide.")
+        else:
+            action(r)
 
     return r.equipe
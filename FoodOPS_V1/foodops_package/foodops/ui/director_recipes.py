@@ -1,34 +1,57 @@
 # -*- coding: utf-8 -*-
-from typing import List
+import sys
+from functools import lru_cache
+from typing import List, Tuple
 from ..domain.restaurant import Restaurant
 from ..data.ingredients import get_all_ingredients, Ingredient
 from ..domain.simple_recipe import SimpleRecipe, Technique, Complexity
 from ..rules.costing import recipe_cost_and_price
+from ..formatting import fmt_eur_cents
+from ..parsing import parse_float, parse_int
 
 def _choose(prompt: str, max_i: int) -> int:
-    try:
-        v = int(input(prompt).strip())
-        if 1 <= v <= max_i:
-            return v
-    except:
-        pass
+    v = parse_int(input(prompt))
+    if v is not None and 1 <= v <= max_i:
+        return v
     return -1
 
-def _fmt_money(x: float) -> str:
-    return f"{x:,.2f} €".replace(",", " ").replace(".", ",")
+_fmt_money = fmt_eur_cents
+
+# Choix proposés à la production (ordre = numéros affichés)
+_TECH_CHOICES = (Technique.FROID, Technique.GRILLE, Technique.SAUTE, Technique.ROTI, Technique.FRIT, Technique.VAPEUR)
+_CPLX_CHOICES = (Complexity.SIMPLE, Complexity.COMPLEXE)
+
+_MENU = (
+    "\n=== Recettes & Achats ===\n"
+    "1) Voir stock ingrédients\n"
+    "2) Acheter ingrédients (kg)\n"
+    "3) Produire des portions (recette simple)\n"
+    "4) Voir produits finis\n"
+    "5) Retour\n"
+)
+# Actions de consultation : le menu reste affiché juste au-dessus, inutile de le réimprimer
+_INFO_CHOICES = frozenset({"1", "4"})
+
+@lru_cache(maxsize=1)
+def _shop_catalog() -> Tuple[Tuple[Ingredient, ...], str]:
+    """Catalogue d'achat (statique, ingrédients figés) et son affichage numéroté, construits une fois."""
+    catalog = tuple(get_all_ingredients())
+    display = "\nCatalogue ingrédients:\n" + "".join(
+        f"{i}) {ing.name} [{ing.grade.name}] — {_fmt_money(ing.base_price_eur_per_kg)}/kg\n"
+        for i, ing in enumerate(catalog, start=1)
+    )
+    return catalog, display
 
 def run_recipes_shop(r: Restaurant, current_tour: int) -> None:
     inv = r.inventory
-    catalog = get_all_ingredients()
+    catalog, catalog_display = _shop_catalog()
 
+    redraw = True
     while True:
-        print("\n=== Recettes & Achats ===")
-        print("1) Voir stock ingrédients")
-        print("2) Acheter ingrédients (kg)")
-        print("3) Produire des portions (recette simple)")
-        print("4) Voir produits finis")
-        print("5) Retour")
+        if redraw:
+            sys.stdout.write(_MENU)
         ch = input("> ").strip()
+        redraw = ch not in _INFO_CHOICES
 
         if ch == "1":
             if not inv.ingredients:
@@ -40,22 +63,19 @@ def run_recipes_shop(r: Restaurant, current_tour: int) -> None:
 
         elif ch == "2":
             # achat simple: choisir ingrédient exact (avec sa gamme) du catalogue
-            print("\nCatalogue ingrédients:")
-            for i, ing in enumerate(catalog, start=1):
-                print(f"{i}) {ing.name} [{ing.grade.name}] — {_fmt_money(ing.base_price_eur_per_kg)}/kg")
+            sys.stdout.write(catalog_display)
             k = _choose("Sélection: ", len(catalog))
             if k == -1:
                 print("Choix invalide.")
                 continue
             ing = catalog[k-1]
-            try:
-                kg = float(input("Quantité (kg) à acheter: ").replace(",", "."))
-                if kg <= 0:
-                    print("Quantité invalide.")
-                    continue
-            except:
+            kg = parse_float(input("Quantité (kg) à acheter: "))
+            if kg is None:
                 print("Saisie invalide.")
                 continue
+            if kg <= 0:
+                print("Quantité invalide.")
+                continue
 
             cost = round(ing.base_price_eur_per_kg * kg, 2)
             if r.funds < cost:
@@ -72,7 +92,7 @@ def run_recipes_shop(r: Restaurant, current_tour: int) -> None:
                 continue
 
             # étape 1: choisir un nom d'ingrédient dispo
-            names = sorted(set(n for (n, _g) in inv.ingredients.keys()))
+            names = inv.ingredient_names()
             print("\nIngrédients disponibles (par nom):")
             for i, n in enumerate(names, start=1):
                 print(f"{i}) {n}")
@@ -96,37 +116,35 @@ def run_recipes_shop(r: Restaurant, current_tour: int) -> None:
             # étape 3: définir la recette simple (technique + complexité + portion_kg)
             print("\nTechnique: 1) FROID  2) GRILLE  3) SAUTE  4) ROTI  5) FRIT  6) VAPEUR")
             kt = _choose("> ", 6)
-            tech = [Technique.FROID, Technique.GRILLE, Technique.SAUTE, Technique.ROTI, Technique.FRIT, Technique.VAPEUR][kt-1]
+            tech = _TECH_CHOICES[kt-1]
 
             print("Complexité: 1) SIMPLE  2) COMPLEXE")
             kc = _choose("> ", 2)
-            cplx = [Complexity.SIMPLE, Complexity.COMPLEXE][kc-1]
+            cplx = _CPLX_CHOICES[kc-1]
 
-            try:
-                portion_kg = float(input("Portion (kg/portion), ex 0.16: ").replace(",", "."))
-                if portion_kg <= 0:
-                    print("Portion invalide.")
-                    continue
-            except:
+            portion_kg = parse_float(input("Portion (kg/portion), ex 0.16: "))
+            if portion_kg is None:
                 print("Saisie invalide.")
                 continue
+            if portion_kg <= 0:
+                print("Portion invalide.")
+                continue
 
             recipe_name = input("Nom de recette (ex: 'Burger bœuf', 'Saumon mi-cuit'): ").strip() or f"{name} - {tech.name.title()}"
             # on crée la recette simple
             recipe = SimpleRecipe.from_ingredient(recipe_name, ing, portion_kg, tech, cplx)
             # calcule prix conseillé selon type de resto
             cogs, price = recipe_cost_and_price(r.type, recipe)
-            recipe.selling_price = price
+            recipe.selling_price = price  # avant add_recipe_to_menu : pas de cache à invalider
             print(f"Prix conseillé: {_fmt_money(price)}  (COGS/portion ≈ {_fmt_money(cogs)})")
 
-            try:
-                portions = int(input("Portions à produire: ").strip())
-                if portions <= 0:
-                    print("Nombre invalide.")
-                    continue
-            except:
+            portions = parse_int(input("Portions à produire: "))
+            if portions is None:
                 print("Saisie invalide.")
                 continue
+            if portions <= 0:
+                print("Nombre invalide.")
+                continue
 
             from ..rules.labour import recipe_prep_minutes_per_portion
 
@@ -159,8 +177,7 @@ def run_recipes_shop(r: Restaurant, current_tour: int) -> None:
             produced_cogs = getattr(r, "turn_cogs", 0.0)
             r.turn_cogs = round(produced_cogs + cogs_total, 2)
             # mémoriser “dernière recette utilisée” si tu veux la remettre dans r.menu aussi
-            if all(rr.name != recipe.name for rr in r.menu):
-                r.menu.append(recipe)
+            r.add_recipe_to_menu(recipe)
 
             print(f"✅ {msg}  | COGS reconnu ce tour: {_fmt_money(cogs_total)}")
 
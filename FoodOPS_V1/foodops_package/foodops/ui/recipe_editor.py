@@ -4,22 +4,52 @@ from ..domain.ingredient import Ingredient
 from ..data.ingredients_fr import INGREDIENTS_FR
 from ..rules import costing
 from ..domain.restaurant import RestaurantType
+from ..parsing import parse_float, parse_int
+
+
+# Politique de prix par type de resto (bistro par défaut)
+_POLICY_BY_TYPE = {
+    RestaurantType.FAST_FOOD: costing.FAST_POLICY,
+    RestaurantType.GASTRO: costing.GASTRO_POLICY,
+}
 
 
 def pick_policy_for_restotype(rt: RestaurantType) -> costing.PricePolicy:
-    if rt == RestaurantType.FAST_FOOD:
-        return costing.FAST_POLICY
-    if rt == RestaurantType.GASTRO:
-        return costing.GASTRO_POLICY
-    return costing.BISTRO_POLICY
+    return _POLICY_BY_TYPE.get(rt, costing.BISTRO_POLICY)
+
+
+def _is_positive(v: float) -> bool:
+    return v > 0
+
+
+def _get_float(prompt: str, is_valid, error_message: str) -> float:
+    """Redemande jusqu'à obtenir un nombre (point ou virgule décimale) accepté par `is_valid`."""
+    while True:
+        v = parse_float(input(prompt))
+        if v is not None and is_valid(v):
+            return v
+        print(error_message)
+
+
+def _get_int(prompt: str, is_valid, error_message: str) -> int:
+    """Redemande jusqu'à obtenir un entier accepté par `is_valid`."""
+    while True:
+        v = parse_int(input(prompt))
+        if v is not None and is_valid(v):
+            return v
+        print(error_message)
+
+
+# Catalogue figé à l'import : noms et ingrédients alignés par index
+# (à réaffecter si le catalogue est rechargé à chaud)
+_CATALOG_NAMES = tuple(INGREDIENTS_FR.keys())
+_CATALOG_ITEMS = tuple(INGREDIENTS_FR.values())
 
 
 def choose_ingredients() -> List[Ingredient]:
     """Sélection multi simple depuis le catalogue FR."""
-    names = list(INGREDIENTS_FR.keys())
     print("\nCatalogue ingrédients (FR) 🍅🥕 :")
-    for i, n in enumerate(names, 1):
-        ing = INGREDIENTS_FR[n]
+    for i, (n, ing) in enumerate(zip(_CATALOG_NAMES, _CATALOG_ITEMS), 1):
         print(f" {i:>2}. {n} — {ing.base_price_eur_per_kg:.2f} €/kg, grade={ing.grade.name}")
     print("Tapez les numéros séparés par des virgules (ex: 1,3,5) ou Enter pour annuler. 📝")
     raw = input("> ").strip()
@@ -27,13 +57,10 @@ def choose_ingredients() -> List[Ingredient]:
         return []
     idxs = []
     for part in raw.split(","):
-        try:
-            j = int(part.strip())
-            if 1 <= j <= len(names):
-                idxs.append(j - 1)
-        except ValueError:
-            pass
-    return [INGREDIENTS_FR[names[j]] for j in idxs]
+        j = parse_int(part)
+        if j is not None and 1 <= j <= len(_CATALOG_ITEMS):
+            idxs.append(j - 1)
+    return [_CATALOG_ITEMS[j] for j in idxs]
 
 
 def build_recipe(rt: RestaurantType) -> Recipe | None:
@@ -50,34 +77,20 @@ def build_recipe(rt: RestaurantType) -> Recipe | None:
 
     lines: List[RecipeLine] = []
     for ing in ings:
-        while True:
-            try:
-                qty = float(input(f"Quantité de {ing.name} (en grammes, ex 120) : "))
-                if qty <= 0: raise ValueError
-                break
-            except ValueError:
-                print("⚠️ Veuillez entrer un nombre positif.")
+        qty = _get_float(f"Quantité de {ing.name} (en grammes, ex 120) : ",
+                         _is_positive, "⚠️ Veuillez entrer un nombre positif.")
         # Étapes de prep (V1 raccourci)
         prep = []
         ans = input("Parage/cuisson ? (o/N) : ").strip().lower()
         if ans == "o":
             while True:
-                try:
-                    lr = float(input("  Perte (%) ex 10 pour -10% (Enter pour terminer) : ") or "NaN")
-                    if lr != lr:  # NaN -> break
-                        break
-                    prep.append(PrepStep(name="loss", loss_ratio=lr/100.0))
-                except ValueError:
+                lr = parse_float(input("  Perte (%) ex 10 pour -10% (Enter pour terminer) : "))
+                if lr is None:  # Enter ou saisie invalide -> fin
                     break
+                prep.append(PrepStep(name="loss", loss_ratio=lr/100.0))
         lines.append(RecipeLine(ingredient=ing, qty_g=qty, prep=prep))
 
-    while True:
-        try:
-            portions = int(input("Nombre de portions (rendement) : "))
-            if portions <= 0: raise ValueError
-            break
-        except ValueError:
-            print("⚠️ Nombre invalide.")
+    portions = _get_int("Nombre de portions (rendement) : ", _is_positive, "⚠️ Nombre invalide.")
 
     r = Recipe(name=name, lines=lines, yield_portions=portions)
 
@@ -93,13 +106,8 @@ def build_recipe(rt: RestaurantType) -> Recipe | None:
     print(f"Qualité estimée (0..1) : {q:.2f} ⭐")
     print(f"Prix conseillé ({policy.name}) : {suggested:.2f} € 💡")
     ans = input("Fixer un prix de vente maintenant ? (Enter = conseillé / valeur = prix €) : ").strip()
-    if ans:
-        try:
-            r.selling_price = max(0.0, float(ans))
-        except ValueError:
-            r.selling_price = suggested
-    else:
-        r.selling_price = suggested
+    price = parse_float(ans) if ans else None
+    r.selling_price = suggested if price is None else max(0.0, price)
 
     # base_quality utilisé par le moteur actuel (scoring déjà en place)
     r.base_quality = q
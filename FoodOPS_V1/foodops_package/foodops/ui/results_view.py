@@ -1,42 +1,72 @@
 # -*- coding: utf-8 -*-
 # foodops/ui/results_view.py
 
-from typing import Optional
+import sys
+from functools import lru_cache
+from math import isfinite
+from typing import Optional, Tuple
+
+from ..formatting import fmt_eur_cents
+
+
+# ---------- Séparateurs (construits une fois) ----------
+
+_SEP_DASH76 = "─" * 76
+_SEP_DASH84 = "-" * 84
 
 
 # ---------- Helpers de formatage ----------
 
-def _fmt_eur(x: float) -> str:
-    try:
-        return f"{float(x):,.2f} €".replace(",", " ").replace(".", ",")
-    except Exception:
-        return f"{x} €"
+# Sortie interactive ? (évalué une fois à l'import)
+_IS_TTY = bool(getattr(sys.stdout, "isatty", None) and sys.stdout.isatty())
+
+_fmt_eur = fmt_eur_cents
+
+def _ratio01(a: float, b: float) -> float:
+    # a/b borné à [0..1] sans passer par min/max (b > 0 garanti par l'appelant)
+    r = a / b
+    return 0.0 if r < 0.0 else 1.0 if r > 1.0 else r
 
 def _pct(a: float, b: float) -> str:
-    try:
-        if b <= 0:
-            return "—"
-        v = max(0.0, min(1.0, float(a) / float(b))) * 100.0
-        return f"{v:5.1f}%"
-    except Exception:
+    if b <= 0:
         return "—"
+    return f"{_ratio01(a, b) * 100.0:5.1f}%"
+
+# Les 25 barres possibles en largeur par défaut, construites une fois
+_BAR_WIDTH = 24
+_BARS = tuple(("█" * n).ljust(_BAR_WIDTH) for n in range(_BAR_WIDTH + 1))
 
-def _bar(current: int, maxv: int, width: int = 24, fill_char: str = "█") -> str:
-    if maxv <= 0:
-        return " " * width
-    ratio = max(0.0, min(1.0, float(current) / float(maxv)))
-    n = int(round(ratio * width))
-    return fill_char * n + " " * (width - n)
+@lru_cache(maxsize=256)
+def _bar_cached(n: int, width: int, fill_char: str) -> str:
+    # Autres largeurs / caractères : peu d'états distincts, mis en cache au premier usage
+    return (fill_char * n).ljust(width)
+
+def _bar(current: int, maxv: int, width: int = _BAR_WIDTH, fill_char: str = "█") -> str:
+    if width == _BAR_WIDTH and fill_char == "█":
+        return _BARS[round(_ratio01(current, maxv) * _BAR_WIDTH)] if maxv > 0 else _BARS[0]
+    n = round(_ratio01(current, maxv) * width) if maxv > 0 else 0
+    return _bar_cached(n, width, fill_char)
 
 def _num(x) -> int:
-    try:
-        return int(x)
-    except Exception:
-        return 0
+    # Cas courant : déjà un int. Sinon seuls les nombres finis sont convertis (pas de try/except)
+    if type(x) is int:
+        return x
+    return int(x) if isinstance(x, (int, float)) and isfinite(x) else 0
 
 
 # ---------- Impression d’un tour ----------
 
+def _compute_kpis(
+    ca: float, cogs: float, fixed_costs: float, marketing: float,
+    rh_cost: float, clients_serv: int, price_med: float,
+) -> Tuple[float, float, float, float]:
+    """(ticket moyen, marge brute, OPEX, résultat opérationnel) à partir des flux du tour."""
+    asp = ca / clients_serv if clients_serv > 0 else price_med
+    gross_margin = ca - cogs
+    opex = fixed_costs + marketing + rh_cost
+    return asp, gross_margin, opex, gross_margin - opex
+
+
 def print_turn_result(tr) -> None:
     """
     Attend un objet 'tr' (SimpleNamespace ou dataclass) avec au minimum :
@@ -77,59 +107,72 @@ def print_turn_result(tr) -> None:
     funds_end   = float(getattr(tr, "funds_end", 0.0) or 0.0)
 
     # KPIs dérivés
-    asp = ca / clients_serv if clients_serv > 0 else price_med
-    gross_margin = ca - cogs
-    opex = fixed_costs + marketing + rh_cost
-    operating_result = gross_margin - opex
-
-    # Barres
-    cap_bar = _bar(clients_serv, max(1, capacity))
-    dem_bar = _bar(clients_serv, max(1, clients_attr))
-
-    print(f"\n────────────────────────────────────────────────────────────────────────────")
-    print(f"  📊 Résultat — {name} — Tour {tour}")
-    print(f"────────────────────────────────────────────────────────────────────────────")
-
-    # Ligne demande/capacité
-    print(f"  Demande attribuée : {clients_attr:>6d}   Couvert(s) servi(s) : {clients_serv:>6d}")
-    print(f"  Capacité RH/salle : {capacity:>6d}   Utilisation capacité : {_pct(clients_serv, capacity):>6}")
-    print(f"  Couverture demande: {_pct(clients_serv, clients_attr):>6}")
-    print(f"  [{cap_bar}] Capacité")
-    print(f"  [{dem_bar}] Demande  ")
-
-    # Prix & CA
-    print(f"\n  Prix médian menu : {_fmt_eur(price_med):>12}   Ticket moyen (réel) : {_fmt_eur(asp):>12}")
-    print(f"  Chiffre d’affaires: {_fmt_eur(ca):>12}")
-
-    # COGS & marge
-    print(f"  COGS (coût prod)  : {_fmt_eur(cogs):>12}")
-    print(f"  Marge brute       : {_fmt_eur(gross_margin):>12}   (taux: {_pct(gross_margin, ca)})")
-
-    # OPEX
-    print(f"\n  Coûts fixes       : {_fmt_eur(fixed_costs):>12}")
-    print(f"  Marketing         : {_fmt_eur(marketing):>12}")
-    print(f"  Masse salariale   : {_fmt_eur(rh_cost):>12}")
-    print(f"  OPEX total        : {_fmt_eur(opex):>12}")
-
-    # Résultat opé
-    print(f"\n  Résultat opé.     : {_fmt_eur(operating_result):>12}")
-
-    # Tréso
-    print(f"\n  Trésorerie début  : {_fmt_eur(funds_start):>12}")
-    print(f"  Trésorerie fin    : {_fmt_eur(funds_end):>12}")
-
-    print(f"────────────────────────────────────────────────────────────────────────────\n")
+    asp, gross_margin, opex, operating_result = _compute_kpis(
+        ca, cogs, fixed_costs, marketing, rh_cost, clients_serv, price_med
+    )
+
+    lines = [
+        "\n" + _SEP_DASH76,
+        f"  📊 Résultat — {name} — Tour {tour}",
+        _SEP_DASH76,
+
+        # Ligne demande/capacité
+        f"  Demande attribuée : {clients_attr:>6d}   Couvert(s) servi(s) : {clients_serv:>6d}",
+        f"  Capacité RH/salle : {capacity:>6d}   Utilisation capacité : {_pct(clients_serv, capacity):>6}",
+        f"  Couverture demande: {_pct(clients_serv, clients_attr):>6}",
+    ]
+
+    # Barres : seulement sur un terminal (inutiles dans un log / une sortie redirigée)
+    if _IS_TTY:
+        lines += [
+            f"  [{_bar(clients_serv, max(1, capacity))}] Capacité",
+            f"  [{_bar(clients_serv, max(1, clients_attr))}] Demande  ",
+        ]
+
+    lines += [
+        # Prix & CA
+        f"\n  Prix médian menu : {_fmt_eur(price_med):>12}   Ticket moyen (réel) : {_fmt_eur(asp):>12}",
+        f"  Chiffre d’affaires: {_fmt_eur(ca):>12}",
+
+        # COGS & marge
+        f"  COGS (coût prod)  : {_fmt_eur(cogs):>12}",
+        f"  Marge brute       : {_fmt_eur(gross_margin):>12}   (taux: {_pct(gross_margin, ca)})",
+
+        # OPEX
+        f"\n  Coûts fixes       : {_fmt_eur(fixed_costs):>12}",
+        f"  Marketing         : {_fmt_eur(marketing):>12}",
+        f"  Masse salariale   : {_fmt_eur(rh_cost):>12}",
+        f"  OPEX total        : {_fmt_eur(opex):>12}",
+
+        # Résultat opé
+        f"\n  Résultat opé.     : {_fmt_eur(operating_result):>12}",
+
+        # Tréso
+        f"\n  Trésorerie début  : {_fmt_eur(funds_start):>12}",
+        f"  Trésorerie fin    : {_fmt_eur(funds_end):>12}",
+
+        _SEP_DASH76 + "\n",
+    ]
 
     # --- Affichage bonus : pertes de clients ---
     losses = getattr(tr, "losses", None)
     if isinstance(losses, dict) and losses.get("lost_total", 0) > 0:
-        print(f"\n  ⚠ Pertes clients : {losses['lost_total']}")
-        print(f"     - Stock insuffisant : {losses['lost_stock']}")
-        print(f"     - Capacité limitée  : {losses['lost_capacity']}")
-        print(f"     - Autres raisons    : {losses['lost_other']}")
+        lines += [
+            f"\n  ⚠ Pertes clients : {losses['lost_total']}",
+            f"     - Stock insuffisant : {losses['lost_stock']}",
+            f"     - Capacité limitée  : {losses['lost_capacity']}",
+            f"     - Autres raisons    : {losses['lost_other']}",
+        ]
+
+    # Un seul write pour tout le rapport
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # ---------- (Optionnel) résumé multi-restos ----------
 
+_SUMMARY_KEYS = ("ca", "cogs", "opex", "result")
+# Gabarit d'une ligne (en-tête compris), compilé une fois
+_SUMMARY_ROW = "{:30} {:>12} {:>12} {:>12} {:>12}".format
+
 def print_multi_summary(rows: list) -> None:
     """
     Affiche un tableau compact pour plusieurs restaurants sur un tour.
@@ -138,14 +181,14 @@ def print_multi_summary(rows: list) -> None:
     """
     if not rows:
         return
-    print("\n================= Synthèse par restaurant =================")
-    print(f"{'Restaurant':30} {'CA':>12} {'COGS':>12} {'OPEX':>12} {'Rés.opé.':>12}")
-    print("-" * 84)
+    row, fmt = _SUMMARY_ROW, _fmt_eur  # alias locaux pour la boucle
+    lines = [
+        "\n================= Synthèse par restaurant =================",
+        row("Restaurant", "CA", "COGS", "OPEX", "Rés.opé."),
+        _SEP_DASH84,
+    ]
     for r in rows:
-        name = str(r.get("name", ""))[:30]
-        ca   = _fmt_eur(r.get("ca", 0.0))
-        cogs = _fmt_eur(r.get("cogs", 0.0))
-        opex = _fmt_eur(r.get("opex", 0.0))
-        res  = _fmt_eur(r.get("result", 0.0))
-        print(f"{name:30} {ca:>12} {cogs:>12} {opex:>12} {res:>12}")
-    print("===========================================================\n")
\ No newline at end of file
+        get = r.get
+        lines.append(row(str(get("name", ""))[:30], *[fmt(get(k, 0.0)) for k in _SUMMARY_KEYS]))
+    lines.append("===========================================================\n")
+    sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
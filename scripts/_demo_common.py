@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+# scripts/_demo_common.py
+"""
+Petits helpers partagés par les scripts de démo / smoke test.
+Aucun import du moteur ici : le module reste léger à charger.
+"""
+
+
+def recipe_price(recipe, default: float = 10.0) -> float:
+    """
+    Prix de vente d'une recette, quel que soit son modèle :
+    `price` (moteur), sinon `selling_price` (alias historique), sinon `default`.
+    """
+    return float(getattr(recipe, "price", None) or getattr(recipe, "selling_price", None) or default)
+
+
+class LocalStub:
+    """Local “stub” (visibilité, places) pour éviter de dépendre d’un Local réel."""
+    __slots__ = ("visibility", "seats")
+
+    def __init__(self, visibility=3.5, seats=45):
+        self.visibility = visibility
+        self.seats = seats
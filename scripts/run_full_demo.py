@@ -16,24 +16,7 @@ il passe en fallback (no-op compta, scénario local simple).
 from types import SimpleNamespace
 import sys
 
-# ---- Imports robustes -------------------------------------------------------
-try:
-    from FoodOPS_V1.foodops_package.foodops.core.game import Game
-except Exception as e:
-    print("❌ Impossible d’importer Game. Vérifie foodops/core/game.py")
-    raise
-
-try:
-    from FoodOPS_V1.foodops_package.foodops.domain.restaurant import Restaurant, RestaurantType
-except Exception:
-    print("❌ Impossible d’importer Restaurant/RestaurantType.")
-    raise
-
-# Local “stub” (visibilité, places) pour éviter de dépendre d’un Local réel
-class LocalStub:
-    def __init__(self, visibility=3.5, seats=45):
-        self.visibility = visibility
-        self.seats = seats
+from scripts._demo_common import LocalStub, recipe_price
 
 def build_menu_for(resto_type):
     try:
@@ -57,7 +40,7 @@ def prime_finished_stock(resto, portions=40):
         resto.inventory = Inventory()
     # choisit le premier plat du menu
     recipe0 = resto.menu[0]
-    price0 = float(getattr(recipe0, "price", getattr(recipe0, "selling_price", 0.0)) or 10.0)
+    price0 = recipe_price(recipe0)
     resto.inventory.add_finished_lot(
         recipe_name=recipe0.name,
         selling_price=price0,
@@ -82,16 +65,21 @@ def add_basic_staff(resto):
     # sinon, on laisse la boucle Game gérer sans RH détaillée
     return added
 
-# Comptabilité no-op si nécessaire
+# Comptabilité no-op si nécessaire (vérifiée une seule fois par process)
+_ACC_CHECKED = False
+_NEEDED_ACC_FNS = ("post_sales", "post_cogs", "post_services_ext", "post_payroll",
+                   "post_depreciation", "post_loan_payment", "month_amortization")
+
 def ensure_accounting_noop():
+    global _ACC_CHECKED
+    if _ACC_CHECKED:
+        return
+    _ACC_CHECKED = True
     try:
         from FoodOPS_V1.foodops_package.foodops.core import accounting as acc
         # on teste l’existence des fonctions ; si elles n’existent pas, on no-op
-        needed = ["post_sales", "post_cogs", "post_services_ext", "post_payroll",
-                  "post_depreciation", "post_loan_payment", "month_amortization"]
-        for fn in needed:
-            if not hasattr(acc, fn):
-                raise RuntimeError("missing acc fn")
+        if not all(hasattr(acc, fn) for fn in _NEEDED_ACC_FNS):
+            raise RuntimeError("missing acc fn")
         return  # tout va bien
     except Exception:
         # Monkeypatch no-op minimal
@@ -109,6 +97,19 @@ def ensure_accounting_noop():
         sys.modules['FoodOPS_V1.foodops_package.foodops.core.accounting'] = noop_mod
 
 def main():
+    # ---- Imports robustes (différés : rien du moteur n'est chargé avant l'exécution) ----
+    try:
+        from FoodOPS_V1.foodops_package.foodops.core.game import Game
+    except Exception:
+        print("❌ Impossible d’importer Game. Vérifie foodops/core/game.py")
+        raise
+
+    try:
+        from FoodOPS_V1.foodops_package.foodops.domain.restaurant import Restaurant, RestaurantType
+    except Exception:
+        print("❌ Impossible d’importer Restaurant/RestaurantType.")
+        raise
+
     ensure_accounting_noop()
 
     # 1) Crée un resto (change ici le type si tu veux tester)
@@ -30,10 +30,13 @@ for r in restos:
     r.reset_rh_minutes()
     r.inventory = Inventory()
 
-# Seed ingrédients (2 gammes)
+# Seed ingrédients (2 gammes) : (nom, gamme, kg, coût/kg, tour, durée de vie)
+SEED = (
+    ("poulet", FoodGrade.G1_FRAIS_BRUT, 5.0, 10.0, 1, 2),
+    ("riz", FoodGrade.G3_SURGELE, 3.0, 2.0, 1, 2),
+)
 for r in restos:
-    r.inventory.add_ingredient("poulet", FoodGrade.G1_FRAIS_BRUT, 5.0, 10.0, current_tour=1, shelf_tours=2)
-    r.inventory.add_ingredient("riz", FoodGrade.G3_SURGELE, 3.0, 2.0, current_tour=1, shelf_tours=2)
+    r.inventory.bulk_seed(SEED)
 
 # Création de 2 recettes simples
 rec1 = SimpleRecipe(name="Poulet Riz", main_ingredient="poulet", portion_kg=0.2, price=12.0, base_quality=0.8)
@@ -42,16 +45,13 @@ for r in restos:
     r.add_recipe_to_menu(rec1)
     r.add_recipe_to_menu(rec2)
 
-# Production de portions
+# Production de portions : (recette, portions)
+PRODUCTION = ((rec1, 10), (rec2, 8))
 for r in restos:
-    needs = r._resolve_recipe_needs(rec1)
-    for name, qty in needs:
-        r.inventory.consume_ingredient(name, qty * 10, current_tour=1)
-    r.inventory.add_finished_lot(rec1.name, rec1.price, 10, produced_tour=1, shelf_tours=1)
-    needs = r._resolve_recipe_needs(rec2)
-    for name, qty in needs:
-        r.inventory.consume_ingredient(name, qty * 8, current_tour=1)
-    r.inventory.add_finished_lot(rec2.name, rec2.price, 8, produced_tour=1, shelf_tours=1)
+    inv = r.inventory
+    for rec, portions in PRODUCTION:
+        inv.bulk_consume(r._resolve_recipe_needs(rec), current_tour=1, factor=portions)
+        inv.add_finished_lot(rec.name, rec.price, portions, produced_tour=1, shelf_tours=1)
 
 # Simule 2 tours avec vente FIFO
 for tour in range(1, 3):
@@ -12,21 +12,18 @@ Valide :
 
 from types import SimpleNamespace
 
-# Imports robustes (adapte "foodops" si ton package s'appelle autrement)
-from FoodOPS_V1.foodops_package.foodops.domain.restaurant import Restaurant, RestaurantType
-from FoodOPS_V1.foodops_package.foodops.domain.inventory import Inventory
-from FoodOPS_V1.foodops_package.foodops.rules.recipe_factory import build_menu_for_type
+# Formatage seul au chargement ; domaine/règles importés dans main() (démarrage plus léger)
+from FoodOPS_V1.foodops_package.foodops.formatting import fmt_eur_cents
+from scripts._demo_common import LocalStub, recipe_price
 
-# Petit local factice
-class LocalStub:
-    def __init__(self, visibility=3.0, seats=40):
-        self.visibility = visibility
-        self.seats = seats
-
-def fmt(x):  # euros
-    return f"{x:,.2f} €".replace(",", " ").replace(".", ",")
+fmt = fmt_eur_cents  # euros (formatage partagé avec l'UI)
 
 def main():
+    # Imports robustes (adapte "foodops" si ton package s'appelle autrement)
+    from FoodOPS_V1.foodops_package.foodops.domain.restaurant import Restaurant, RestaurantType
+    from FoodOPS_V1.foodops_package.foodops.domain.inventory import Inventory
+    from FoodOPS_V1.foodops_package.foodops.rules.recipe_factory import build_menu_for_type
+
     # 1) Resto bistro (mais tu peux passer FAST_FOOD / GASTRO)
     rtype = RestaurantType.BISTRO
     resto = Restaurant(
@@ -38,15 +35,18 @@ def main():
     # 2) Menu auto (15 recettes pour un bistro)
     menu = build_menu_for_type(rtype)
     resto.menu = menu
-    print(f"✔ Menu généré : {len(menu)} recettes. Exemple :")
-    for m in menu[:3]:
-        price = getattr(m, "price", getattr(m, "selling_price", 0.0))
-        print(f"   - {m.name} — {fmt(price)} (q≈{getattr(m, 'base_quality', 0.0):.2f})")
+    # Aperçu : lignes formatées une fois, une seule écriture
+    preview = [f"✔ Menu généré : {len(menu)} recettes. Exemple :"]
+    preview += [
+        f"   - {m.name} — {fmt(recipe_price(m, default=0.0))} (q≈{getattr(m, 'base_quality', 0.0):.2f})"
+        for m in menu[:3]
+    ]
+    print("\n".join(preview))
 
     # 3) Injecte un lot de produits finis (simulateur de prod)
     resto.inventory = Inventory()
     recipe0 = menu[0]
-    price0 = float(getattr(recipe0, "price", getattr(recipe0, "selling_price", 0.0)) or 10.0)
+    price0 = recipe_price(recipe0)
     portions = 30
     resto.inventory.add_finished_lot(
         recipe_name=recipe0.name,